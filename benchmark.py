@@ -0,0 +1,146 @@
+import contextlib
+import io
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from solutions import load_part
+from solutions.common import clear_input_cache
+
+
+@dataclass
+class PartBenchmark:
+    day: str
+    part: str
+    min: float
+    median: float
+    p95: float
+    peak_memory: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}{self.part}"
+
+
+def benchmark_part(day: str, part: str, repeat: int, warmup: int) -> PartBenchmark:
+    if repeat < 1:
+        raise ValueError("At least one timed run is needed")
+    solve = load_part(day, part)
+    times = []
+    # Anything the part prints is discarded
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            solve()
+        for _ in range(repeat):
+            # Each run loads its input, as the first part to run in a process would
+            clear_input_cache()
+            start = time.perf_counter()
+            solve()
+            times.append(time.perf_counter() - start)
+
+        # Measured in a separate run, as tracing allocations slows everything down
+        clear_input_cache()
+        tracemalloc.start()
+        solve()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    if len(times) > 1:
+        p95 = statistics.quantiles(times, n=20, method="inclusive")[-1]
+    else:
+        p95 = times[0]
+    return PartBenchmark(
+        day=day,
+        part=part,
+        min=min(times),
+        median=statistics.median(times),
+        p95=p95,
+        peak_memory=peak_memory,
+    )
+
+
+HEADER = (
+    f"{'Day':<5}{'Part':<6}{'Min (s)':>10}{'Median (s)':>12}{'p95 (s)':>10}"
+    f"{'Peak (KiB)':>12}"
+)
+
+
+def format_result(r: PartBenchmark) -> str:
+    return (
+        f"{r.day:<5}{r.part:<6}{r.min:>10.4f}{r.median:>12.4f}{r.p95:>10.4f}"
+        f"{r.peak_memory / 1024:>12.1f}"
+    )
+
+
+def save_baseline(path: Path, results: list[PartBenchmark]):
+    with open(path, "w") as f:
+        json.dump({r.key: asdict(r) for r in results}, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: Path) -> dict[str, PartBenchmark]:
+    with open(path) as f:
+        return {key: PartBenchmark(**r) for key, r in json.load(f).items()}
+
+
+def find_regressions(
+    results: list[PartBenchmark],
+    baseline: dict[str, PartBenchmark],
+    threshold: float,
+) -> list[tuple[PartBenchmark, float]]:
+    """Parts whose median time has grown by more than threshold times the baseline"""
+    regressions = []
+    for r in results:
+        previous = baseline.get(r.key)
+        if previous is None or previous.median == 0:
+            continue
+        slowdown = r.median / previous.median
+        if slowdown > threshold:
+            regressions.append((r, slowdown))
+    return regressions
+
+
+@dataclass
+class StartupBenchmark:
+    day: str
+    wall: float
+    imports: float
+    heaviest: list[tuple[str, float]]
+
+
+def benchmark_startup(day: str, top: int) -> StartupBenchmark:
+    """
+    Times a fresh interpreter importing main and the day's solution, without
+    solving anything, using -X importtime to attribute the time spent importing.
+    """
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        f"import main; main.load_day({day!r})",
+    ]
+    start = time.perf_counter()
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+
+    imports = 0.0
+    self_times = []
+    for line in completed.stderr.splitlines():
+        # Lines look like "import time: <self us> | <cumulative us> | <package>",
+        # with the package indented by how deeply it was imported
+        _, _, fields = line.partition("import time:")
+        self_us, _, rest = fields.partition("|")
+        cumulative_us, _, package = rest.partition("|")
+        if not self_us.strip().isdigit():
+            continue
+        self_times.append((package.strip(), int(self_us) / 1e6))
+        if not package[1:].startswith(" "):
+            imports += int(cumulative_us) / 1e6
+
+    heaviest = sorted(self_times, key=lambda t: t[1], reverse=True)[:top]
+    return StartupBenchmark(day=day, wall=wall, imports=imports, heaviest=heaviest)
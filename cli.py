@@ -0,0 +1,272 @@
+"""Command line interface, for anything beyond running a single day"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+import click
+
+import benchmark
+import profiler
+from main import run_day
+from solutions import PARTS, available_days, load_generator, load_part
+
+# Wall times from the last parallel run, used to start the slowest parts first
+TIMINGS_FILE = Path(".timings.json")
+
+
+def parse_days(target: str) -> list[str]:
+    """Days for 'all', a range such as '5-12', or a single day"""
+    available = available_days()
+    if target == "all":
+        return available
+    start, sep, end = target.partition("-")
+    if not sep:
+        return [target.zfill(2)]
+    return [d for d in available if int(start) <= int(d) <= int(end)]
+
+
+def solve_part(day: str, part: str) -> tuple[str, float, float]:
+    """Returns everything the part prints, followed by its answer, and its times"""
+    solve = load_part(day, part)
+    output = io.StringIO()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    with contextlib.redirect_stdout(output):
+        answer = solve()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    return f"{output.getvalue()}{answer}\n", wall, cpu
+
+
+def load_timings() -> dict[str, float]:
+    try:
+        with open(TIMINGS_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def run_parallel(days: list[str], workers: int | None):
+    jobs = [(day, part) for day in days for part in PARTS]
+    timings = load_timings()
+    # Longest job first, with parts never timed before treated as the longest
+    ordered = sorted(
+        jobs, key=lambda job: timings.get("".join(job), float("inf")), reverse=True
+    )
+
+    wall_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {job: executor.submit(solve_part, *job) for job in ordered}
+        results = {job: future.result() for job, future in futures.items()}
+    total_wall = time.perf_counter() - wall_start
+
+    for job in jobs:
+        output, _, _ = results[job]
+        print(output, end="")
+
+    print()
+    print(f"{'Day':<5}{'Part':<6}{'Wall (s)':>10}{'CPU (s)':>10}")
+    for day, part in jobs:
+        _, wall, cpu = results[(day, part)]
+        print(f"{day:<5}{part:<6}{wall:>10.3f}{cpu:>10.3f}")
+    total_cpu = sum(cpu for _, _, cpu in results.values())
+    print(
+        f"Total wall clock {total_wall:.3f}s, CPU {total_cpu:.3f}s "
+        f"({total_cpu / total_wall:.1f}x parallelism)"
+    )
+
+    timings.update({"".join(job): wall for job, (_, wall, _) in results.items()})
+    with open(TIMINGS_FILE, "w") as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+
+class DefaultGroup(click.Group):
+    """Group that falls back to the run command, so 'main.py 5' still works"""
+
+    def resolve_command(self, ctx: click.Context, args: list[str]):
+        if args and args[0] not in self.commands:
+            args.insert(0, "run")
+        return super().resolve_command(ctx, args)
+
+
+@click.group(cls=DefaultGroup)
+def cli():
+    pass
+
+
+@cli.command()
+@click.argument("day")
+@click.option(
+    "--workers", type=int, help="Processes for 'all' or ranges, defaults to all cores"
+)
+@click.option("--profile", is_flag=True, help="Run each part under cProfile")
+@click.option(
+    "--tracemalloc", "trace", is_flag=True, help="Run each part under tracemalloc"
+)
+@click.option(
+    "--top", default=20, show_default=True, help="Functions and allocations to report"
+)
+@click.option(
+    "--dump-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to save .prof files from --profile in",
+)
+@click.option(
+    "--parse-inputs",
+    is_flag=True,
+    help="Parse inputs when profiling, rather than loading them pickled",
+)
+def run(
+    day: str,
+    workers: int | None,
+    profile: bool,
+    trace: bool,
+    top: int,
+    dump_dir: Path | None,
+    parse_inputs: bool,
+):
+    """Run DAY, 'all' days or a range of days such as 5-12"""
+    if day == "all" or "-" in day:
+        if profile or trace:
+            raise click.UsageError("Profiling is only supported for a single day")
+        run_parallel(parse_days(day), workers)
+        return
+
+    day = day.zfill(2)
+    if profile or trace:
+        run_profiled(day, profile, trace, top, dump_dir, parse_inputs)
+        return
+    run_day(day)
+
+
+def run_profiled(
+    day: str,
+    profile: bool,
+    trace: bool,
+    top: int,
+    dump_dir: Path | None,
+    parse_inputs: bool,
+):
+    """
+    Profiles and traces each part in separate runs, so neither skews the other.
+    Every run loads its own input, so each one's profile includes loading it.
+    """
+    for part in PARTS:
+        if profile:
+            answer, report = profiler.profile_part(
+                day, part, top, dump_dir, parse_inputs
+            )
+            print(f"Part {part}: {answer}")
+            print(report)
+        if trace:
+            answer, report = profiler.trace_part_allocations(
+                day, part, top, parse_inputs
+            )
+            print(f"Part {part}: {answer}")
+            print(report)
+
+
+@cli.command()
+@click.argument("days", default="all")
+@click.option(
+    "--repeat",
+    "-n",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Timed runs",
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Untimed runs first",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(path_type=Path),
+    default="bench_baseline.json",
+    show_default=True,
+    help="Baseline to compare against",
+)
+@click.option("--save", is_flag=True, help="Save the results as the new baseline")
+@click.option(
+    "--threshold",
+    default=1.25,
+    show_default=True,
+    help="Slowdown in median time, relative to the baseline, counted as a regression",
+)
+def bench(
+    days: str, repeat: int, warmup: int, baseline: Path, save: bool, threshold: float
+):
+    """Time each part of DAYS, 'all' by default, and check for regressions"""
+    results = []
+    print(benchmark.HEADER)
+    for day in parse_days(days):
+        for part in PARTS:
+            results.append(benchmark.benchmark_part(day, part, repeat, warmup))
+            print(benchmark.format_result(results[-1]))
+
+    if save:
+        benchmark.save_baseline(baseline, results)
+        print(f"Saved baseline to {baseline}")
+        return
+    if not baseline.exists():
+        return
+
+    regressions = benchmark.find_regressions(
+        results, benchmark.load_baseline(baseline), threshold
+    )
+    for r, slowdown in regressions:
+        print(f"Regression: day {r.day} part {r.part} is {slowdown:.2f}x slower")
+    if regressions:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("days", default="all")
+@click.option(
+    "--budget",
+    default=150,
+    show_default=True,
+    help="Cold start time allowed for each day, in milliseconds",
+)
+@click.option("--top", default=3, show_default=True, help="Heaviest imports to show")
+def startup(days: str, budget: int, top: int):
+    """Time starting up to run each of DAYS, failing if any are over budget"""
+    print(f"{'Day':<5}{'Wall (ms)':>10}{'Imports (ms)':>14}  Heaviest imports (ms)")
+    over_budget = []
+    for day in parse_days(days):
+        r = benchmark.benchmark_startup(day, top)
+        heaviest = ", ".join(f"{name} {t * 1000:.1f}" for name, t in r.heaviest)
+        print(f"{day:<5}{r.wall * 1000:>10.1f}{r.imports * 1000:>14.1f}  {heaviest}")
+        if r.wall * 1000 > budget:
+            over_budget.append(day)
+
+    if over_budget:
+        print(f"Over the {budget}ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("day")
+@click.option("--size", default=1000, show_default=True, help="Scale of the input")
+@click.option("--seed", default=0, show_default=True, help="Seed for the input")
+@click.option(
+    "--output", "-o", type=click.File("w"), default="-", help="Defaults to stdout"
+)
+def generate(day: str, size: int, seed: int, output: TextIO):
+    """
+    Write a synthetic input for DAY, which its solution can parse. What size means
+    depends on the day, such as the number of lines or the width of a grid.
+    """
+    load_generator(day)(output, size, random.Random(seed))
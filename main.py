@@ -1,19 +1,27 @@
-import importlib
+import sys
 
-import click
+from solutions import load_day
 
 
-@click.command()
-@click.argument("day")
-def run(day: str):
-    day = day.zfill(2)
-    module_path = f"solutions.day_{day}.solution"
-    module = importlib.import_module(module_path)
+def run_day(day: str):
+    module = load_day(day)
     try:
         getattr(module, "run")()
     except AttributeError:
         print(f"Module needs run function")
 
 
+def main():
+    args = sys.argv[1:]
+    # Running one day is the common case, so it skips importing the full CLI
+    if len(args) == 1 and args[0].isdigit():
+        run_day(args[0])
+        return
+
+    from cli import cli
+
+    cli()
+
+
 if __name__ == "__main__":
-    run()
+    main()
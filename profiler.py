@@ -0,0 +1,75 @@
+import contextlib
+import cProfile
+import io
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import ContextManager, Optional
+
+from solutions import load_part
+from solutions.common import bypass_input_cache, clear_input_cache
+
+
+def _fresh_inputs(parse_inputs: bool) -> ContextManager:
+    """
+    Forgets inputs loaded by parts run earlier, so every part loads its own, and
+    if parse_inputs is set has them parsed rather than loaded from pickles
+    """
+    clear_input_cache()
+    return bypass_input_cache() if parse_inputs else contextlib.nullcontext()
+
+
+def profile_part(
+    day: str,
+    part: str,
+    top: int,
+    dump_dir: Optional[Path] = None,
+    parse_inputs: bool = False,
+) -> tuple[int, str]:
+    """
+    Runs a part under cProfile, returning its answer and a report of the top
+    functions by cumulative time. The full profile is dumped to dump_dir if set,
+    for viewing in snakeviz or similar.
+    """
+    solve = load_part(day, part)
+    profiler = cProfile.Profile()
+    with _fresh_inputs(parse_inputs):
+        profiler.enable()
+        answer = solve()
+        profiler.disable()
+
+    if dump_dir is not None:
+        dump_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(dump_dir / f"day_{day}_{part}.prof")
+
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(top)
+    return answer, report.getvalue()
+
+
+def trace_part_allocations(
+    day: str, part: str, top: int, parse_inputs: bool = False
+) -> tuple[int, str]:
+    """
+    Runs a part under tracemalloc, returning its answer and a report of the lines
+    which allocated the most memory still held when the part finished, and the
+    peak.
+    """
+    solve = load_part(day, part)
+    with _fresh_inputs(parse_inputs):
+        tracemalloc.start()
+        answer = solve()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        )
+    )
+    lines = [f"Peak traced memory: {peak / 1024:.1f} KiB", "Top allocation sites:"]
+    for stat in snapshot.statistics("lineno")[:top]:
+        lines.append(f"  {stat}")
+    return answer, "\n".join(lines) + "\n"
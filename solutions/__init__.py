@@ -0,0 +1,36 @@
+"""
+Registry of the days solved, found from the day_XX package directories so that
+no solution is imported until it is run.
+"""
+
+import importlib
+import os
+import random
+from types import ModuleType
+from typing import Callable, TextIO
+
+PARTS = ("a", "b")
+
+_PACKAGE_DIR = os.path.dirname(__file__)
+
+
+def available_days() -> list[str]:
+    return sorted(
+        entry.name.removeprefix("day_")
+        for entry in os.scandir(_PACKAGE_DIR)
+        if entry.is_dir() and entry.name.startswith("day_")
+    )
+
+
+def load_day(day: str) -> ModuleType:
+    return importlib.import_module(f"solutions.day_{day.zfill(2)}.solution")
+
+
+def load_part(day: str, part: str) -> Callable[[], int]:
+    return getattr(load_day(day), f"solve_part_{part}")
+
+
+def load_generator(day: str) -> Callable[[TextIO, int, random.Random], None]:
+    """The function writing synthetic inputs of a given size for a day"""
+    module = importlib.import_module(f"solutions.day_{day.zfill(2)}.generate")
+    return module.generate
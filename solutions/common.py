@@ -1,25 +1,76 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterator, Optional, TextIO
+import contextlib
+import functools
+import hashlib
+import itertools
+import mmap
+import os
+import pickle
+from array import array
+from types import MappingProxyType
+from typing import (
+    IO,
+    BinaryIO,
+    Callable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TextIO,
+    TypeVar,
+)
 
+# Maps ASCII digits to their values, so a line of digits can be parsed in one call
+_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# Bytes of a memory mapped file parsed at once by read_ints
+_MMAP_CHUNK = 1 << 22
+
+# What read_ints splits numbers on
+_SEPARATORS = b", \t\n\r\x0b\x0c"
+
+# Builds a Point without going through the argument handling of Point.__new__
+_tuple_new = tuple.__new__
+
+
+class Point(NamedTuple):
+    """
+    Tuple based, so points hash and compare in C and plain (x, z) tuples can be
+    used wherever a Point is looked up.
+    """
 
-@dataclass(frozen=True)
-class Point:
     x: int = 0
     z: int = 0  # Depth (higher is deeper)
 
     def __add__(self, o: Point) -> Point:
-        return Point(x=self.x + o.x, z=self.z + o.z)
+        return _tuple_new(Point, (self.x + o.x, self.z + o.z))
 
     def __mul__(self, o: int) -> Point:
-        return Point(x=o * self.x, z=o * self.z)
+        return _tuple_new(Point, (o * self.x, o * self.z))
 
     def __rmul__(self, o: int) -> Point:
         return self.__mul__(o)
 
 
+ULDR = (Point(0, -1), Point(0, 1), Point(-1, 0), Point(1, 0))
+DIAGONALS = (Point(-1, -1), Point(1, -1), Point(-1, 1), Point(1, 1))
+
+
+def pack_point(p: Point, width: int) -> int:
+    """Encodes a point with 0 <= x < width as a single int"""
+    x, z = p
+    return z * width + x
+
+
+def unpack_point(i: int, width: int) -> Point:
+    z, x = divmod(i, width)
+    return Point(x, z)
+
+
 class IntGrid:
+    """Sparse grid of integers, stored as a dict keyed by Point"""
+
     def __init__(self):
         self.grid: dict[Point, int] = {}
 
@@ -40,16 +91,28 @@ class IntGrid:
         return len(self.grid)
 
     def __add__(self, o: IntGrid) -> IntGrid:
-        return self.from_dict({**self.grid, **o.grid})
+        if isinstance(o, DenseIntGrid):
+            return DenseIntGrid.merge(self, o)
+        return self.from_dict({**self.grid, **o.grid}, sparse=True)
 
     @staticmethod
-    def from_dict(d: dict[Point, int]) -> IntGrid:
+    def from_dict(d: dict[Point, int], sparse: bool = False) -> IntGrid:
+        """
+        Grids filling at least half of their bounding box are stored densely,
+        unless sparse is set.
+        """
+        if not sparse and d:
+            dense = DenseIntGrid._from_dict(d)
+            if dense is not None:
+                return dense
         grid = IntGrid()
         grid.grid = d
         return grid
 
     @staticmethod
-    def from_file(f: TextIO) -> IntGrid:
+    def from_file(f: TextIO, sparse: bool = False) -> IntGrid:
+        if not sparse:
+            return DenseIntGrid.from_file(f)
         grid = IntGrid()
         for j, line in enumerate(f):
             for i, character in enumerate(line.rstrip()):
@@ -89,12 +152,619 @@ class IntGrid:
         return Point(min_x, min_z), Point(max_x, max_z)
 
 
-ULDR = (Point(0, -1), Point(0, 1), Point(-1, 0), Point(1, 0))
+class Adjacency:
+    """
+    Compressed sparse rows of the indices adjacent to each index of a dense grid:
+    those of index i are targets[offsets[i] : offsets[i + 1]].
+    """
+
+    def __init__(self, offsets: array, targets: array):
+        self.offsets = offsets
+        self.targets = targets
+
+    def __getitem__(self, i: int) -> array:
+        return self.targets[self.offsets[i] : self.offsets[i + 1]]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @staticmethod
+    def build(
+        width: int, height: int, diagonal: bool, present: Optional[bytearray] = None
+    ) -> Adjacency:
+        """
+        Built a row at a time from slices of an array holding every index, so no
+        index is worked out on its own
+        """
+        directions = ULDR + DIAGONALS if diagonal else ULDR
+        typecode = _index_typecode(width * (height + 2))
+        if not width:
+            return Adjacency(array(typecode, [0]), array(typecode))
+        # Every index from a row before the grid to a row after, each at itself
+        # plus base, so the neighbours of a row in any direction are one slice
+        base = width + 1
+        indices = array(typecode, range(-base, width * height + base))
+        targets = array(typecode)
+        counts = bytearray()
+        for j in range(height):
+            first = base + j * width
+            row_directions = [(dx, dz) for dx, dz in directions if 0 <= j + dz < height]
+            if present is None:
+                Adjacency._add_full_row(
+                    targets, counts, indices, first, width, row_directions
+                )
+            else:
+                Adjacency._add_row_with_gaps(
+                    targets, counts, indices, first, width, row_directions, present
+                )
+        offsets = array(
+            _index_typecode(len(targets)), itertools.accumulate(counts, initial=0)
+        )
+        return Adjacency(offsets, targets)
+
+    @staticmethod
+    def _add_full_row(
+        targets: array,
+        counts: bytearray,
+        indices: array,
+        first: int,
+        width: int,
+        directions: list[Point],
+    ):
+        """
+        In a grid without gaps, every index of a row but the first and last has a
+        neighbour in each of the directions, so their targets are the slices for
+        each direction interleaved
+        """
+
+        def edge(x: int) -> list[int]:
+            return [
+                indices[first + x + dz * width + dx]
+                for dx, dz in directions
+                if 0 <= x + dx < width
+            ]
+
+        slots = len(directions)
+        middle = max(width - 2, 0)
+        block = array(targets.typecode, bytes(middle * slots * targets.itemsize))
+        for d, (dx, dz) in enumerate(directions):
+            start = first + 1 + dz * width + dx
+            block[d::slots] = indices[start : start + middle]
+
+        left = edge(0)
+        right = edge(width - 1) if width > 1 else []
+        targets.extend(left)
+        targets.extend(block)
+        targets.extend(right)
+        counts.append(len(left))
+        counts += bytes([slots]) * middle
+        if width > 1:
+            counts.append(len(right))
+
+    @staticmethod
+    def _add_row_with_gaps(
+        targets: array,
+        counts: bytearray,
+        indices: array,
+        first: int,
+        width: int,
+        directions: list[Point],
+        present: bytearray,
+    ):
+        """
+        Each index of the row has a slot for each direction, and those off the
+        grid or on gaps are dropped by compress
+        """
+        slots = len(directions)
+        row_targets = array(targets.typecode, bytes(width * slots * targets.itemsize))
+        valid = bytearray(width * slots)
+        for d, (dx, dz) in enumerate(directions):
+            start = first + dz * width + dx
+            row_targets[d::slots] = indices[start : start + width]
+            # Indices in the row whose neighbour this way is in the box
+            low, high = max(0, -dx), width - max(0, dx)
+            neighbours = indices[start]
+            valid[d + low * slots : high * slots : slots] = present[
+                neighbours + low : neighbours + high
+            ]
+
+        # Gaps have no neighbours, which is masking with the row spread out
+        row = indices[first]
+        spread = bytearray(width * slots)
+        for d in range(slots):
+            spread[d::slots] = present[row : row + width]
+        mask = int.from_bytes(valid, "little") & int.from_bytes(spread, "little")
+        valid = mask.to_bytes(len(valid), "little")
+
+        # The bytes of each index's count add up without carrying, being at most 8
+        row_counts = sum(
+            int.from_bytes(valid[d::slots], "little") for d in range(slots)
+        )
+        counts += row_counts.to_bytes(width, "little")
+        targets.extend(itertools.compress(row_targets, valid))
+
+
+def _index_typecode(limit: int) -> str:
+    """The narrowest signed array typecode holding indices up to limit"""
+    return next(t for t in "hiq" if limit < 1 << (8 * array(t).itemsize - 1))
+
+
+@functools.lru_cache(maxsize=8)
+def _shape_adjacency(width: int, height: int, diagonal: bool) -> Adjacency:
+    """Adjacency of a grid without gaps, shared between grids of the same shape"""
+    return Adjacency.build(width, height, diagonal)
+
+
+class DenseIntGrid(IntGrid):
+    """
+    Grid of integers stored row by row in a flat array covering the bounding box,
+    with the top left corner at origin. If present is set, it marks which points
+    within the box are part of the grid, otherwise all of them are.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        origin: Point = Point(),
+        values: Optional[array] = None,
+        present: Optional[bytearray] = None,
+    ):
+        area = width * height
+        if values is None:
+            values = array("B", bytes(area))
+        if len(values) != area or (present is not None and len(present) != area):
+            raise ValueError("Number of values does not match grid size")
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self.values = values
+        self.present = present
+        self._count = area if present is None else present.count(1)
+
+    def _index(self, p: Point) -> Optional[int]:
+        x, z = p
+        x -= self.origin.x
+        z -= self.origin.z
+        if 0 <= x < self.width and 0 <= z < self.height:
+            index = z * self.width + x
+            if self.present is None or self.present[index]:
+                return index
+        return None
+
+    def pack(self, p: Point) -> int:
+        """Encodes a point in the grid as its int index into values"""
+        index = self._index(p)
+        if index is None:
+            raise KeyError(p)
+        return index
+
+    def unpack(self, i: int) -> Point:
+        z, x = divmod(i, self.width)
+        return Point(self.origin.x + x, self.origin.z + z)
+
+    def __iter__(self) -> Iterator[tuple[Point, int]]:
+        # Points are made a row at a time as they are reached, so none outlive the
+        # loop using them
+        values, present, width = self.values, self.present, self.width
+        origin_x, origin_z = self.origin
+        xs = range(origin_x, origin_x + width)
+        for j in range(self.height):
+            zs = itertools.repeat(origin_z + j)
+            points = map(_tuple_new, itertools.repeat(Point), zip(xs, zs))
+            row = zip(points, values[j * width : (j + 1) * width])
+            if present is None:
+                yield from row
+            else:
+                yield from itertools.compress(row, present[j * width : (j + 1) * width])
+
+    def __getitem__(self, p: Point) -> int:
+        index = self._index(p)
+        if index is None:
+            raise KeyError(p)
+        return self.values[index]
+
+    def __setitem__(self, p: Point, v: int):
+        x, z = p
+        x -= self.origin.x
+        z -= self.origin.z
+        if not (0 <= x < self.width and 0 <= z < self.height):
+            self._grow_to(p)
+            x, z = p
+            x -= self.origin.x
+            z -= self.origin.z
+        index = z * self.width + x
+        try:
+            self.values[index] = v
+        except OverflowError:
+            # Values no longer fit in a byte, so widen the whole array
+            self.values = array("q", self.values)
+            self.values[index] = v
+        if self.present is not None and not self.present[index]:
+            self.present[index] = 1
+            self._count += 1
+            if self._count == len(self.present):
+                self.present = None
+
+    def _grow_to(self, p: Point):
+        """
+        Extends the box to cover p, keeping the values already set. Raises
+        ValueError if the box would then be mostly gaps, as such grids belong in
+        sparse storage, from IntGrid.from_dict with sparse set.
+        """
+        x, z = p
+        if self._count:
+            low, high = self.bounds
+            origin = Point(min(low.x, x), min(low.z, z))
+            width = max(high.x, x) - origin.x + 1
+            height = max(high.z, z) - origin.z + 1
+        else:
+            origin, width, height = Point(x, z), 1, 1
+        if width * height > 2 * (self._count + 1):
+            raise ValueError(f"{p} is too far outside the grid to store densely")
+
+        typecode = self.values.typecode
+        values = array(typecode, bytes(width * height * array(typecode).itemsize))
+        grown = DenseIntGrid(width, height, origin, values, bytearray(width * height))
+        if self._count:
+            grown._copy_rows(self)
+        self.__dict__.update(grown.__dict__)
+
+    def __contains__(self, p: Point) -> bool:
+        return self._index(p) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __add__(self, o: IntGrid) -> IntGrid:
+        return self.merge(self, o)
+
+    def adjacency(self, diagonal: bool = False) -> Adjacency:
+        """
+        Indices adjacent to each index in the grid, up, down, left and right and
+        also diagonally if set, for walking the grid using values directly.
+        """
+        if self.present is None:
+            return _shape_adjacency(self.width, self.height, diagonal)
+        return Adjacency.build(self.width, self.height, diagonal, self.present)
+
+    @property
+    def grid(self) -> Mapping[Point, int]:
+        """
+        Read only copy of the grid as a dict, as it would be stored sparsely. Set
+        values through the grid itself. The dict is built afresh on every access,
+        so keep hold of it rather than using it in a loop, or iterate over the
+        grid itself for its points and values.
+        """
+        return MappingProxyType(dict(iter(self)))
+
+    @staticmethod
+    def merge(a: IntGrid, b: IntGrid) -> IntGrid:
+        """Union of two grids, taking values from b where they overlap"""
+        (a_min, a_max), (b_min, b_max) = a.bounds, b.bounds
+        origin = Point(min(a_min.x, b_min.x), min(a_min.z, b_min.z))
+        width = max(a_max.x, b_max.x) - origin.x + 1
+        height = max(a_max.z, b_max.z) - origin.z + 1
+        if width * height > 2 * (len(a) + len(b)):
+            return IntGrid.from_dict(dict(itertools.chain(a, b)), sparse=True)
+
+        typecodes = {g.values.typecode for g in (a, b) if isinstance(g, DenseIntGrid)}
+        typecode = "q" if "q" in typecodes else "B"
+        values = array(typecode, bytes(width * height * array(typecode).itemsize))
+        grid = DenseIntGrid(width, height, origin, values, bytearray(width * height))
+        grid._copy_rows(a)
+        grid._copy_rows(b)
+        return grid
+
+    def _copy_rows(self, source: IntGrid):
+        """
+        Copies a grid lying within the bounds of this one. Dense grids are copied
+        a row at a time, unless gaps in them would overwrite values already set.
+        """
+        if not isinstance(source, DenseIntGrid) or (
+            source.present is not None and self._count
+        ):
+            for p, v in source:
+                self[p] = v
+            return
+
+        x = source.origin.x - self.origin.x
+        for j in range(source.height):
+            start = (source.origin.z - self.origin.z + j) * self.width + x
+            end = start + source.width
+            source_values = source.values[j * source.width : (j + 1) * source.width]
+            if source_values.typecode != self.values.typecode:
+                source_values = array(self.values.typecode, source_values)
+            self.values[start:end] = source_values
+            if self.present is not None:
+                if source.present is None:
+                    self.present[start:end] = b"\x01" * source.width
+                else:
+                    self.present[start:end] = source.present[
+                        j * source.width : (j + 1) * source.width
+                    ]
+        if self.present is not None:
+            self._count = self.present.count(1)
+            if self._count == len(self.present):
+                self.present = None
+
+    @staticmethod
+    def _from_dict(d: dict[Point, int]) -> Optional[DenseIntGrid]:
+        """Returns None if d fills less than half of its bounding box"""
+        xs = [p.x for p in d]
+        zs = [p.z for p in d]
+        origin = Point(min(xs), min(zs))
+        width = max(xs) - origin.x + 1
+        height = max(zs) - origin.z + 1
+        if width * height > 2 * len(d):
+            return None
+
+        present = None if len(d) == width * height else bytearray(width * height)
+        grid = DenseIntGrid(width, height, origin, present=present)
+        for p, v in d.items():
+            grid[p] = v
+        return grid
+
+    @staticmethod
+    def from_grid(grid: IntGrid) -> DenseIntGrid:
+        """
+        The grid itself if it is dense, otherwise a dense copy of it over its
+        bounding box, for code that works on values and adjacency directly
+        """
+        if isinstance(grid, DenseIntGrid):
+            return grid
+        if not len(grid):
+            return DenseIntGrid(0, 0)
+        low, high = grid.bounds
+        width, height = high.x - low.x + 1, high.z - low.z + 1
+        dense = DenseIntGrid(width, height, low, present=bytearray(width * height))
+        dense._copy_rows(grid)
+        return dense
+
+    @staticmethod
+    def from_file(f: TextIO) -> DenseIntGrid:
+        """
+        Blank lines hold no points, as when read sparsely, so those between rows
+        leave gaps and those at the ends are left out of the box.
+        """
+        values = array("B")
+        gaps = []
+        width = height = top = 0
+        for j, line in enumerate(f):
+            row = line.rstrip().encode()
+            if not row:
+                continue
+            if row.translate(None, b"0123456789"):
+                raise ValueError(f"Grid line {line.rstrip()!r} is not all digits")
+            if height == 0:
+                width, top = len(row), j
+            elif len(row) != width:
+                raise ValueError("All lines must be the same length")
+            while top + height < j:
+                gaps.append(height)
+                values.frombytes(bytes(width))
+                height += 1
+            values.frombytes(row.translate(_DIGITS))
+            height += 1
+
+        present = None
+        if gaps:
+            present = bytearray(b"\x01") * (width * height)
+            for gap in gaps:
+                present[gap * width : (gap + 1) * width] = bytes(width)
+        return DenseIntGrid(width, height, Point(0, top), values, present)
+
+    def get(self, p: Point) -> Optional[int]:
+        # Inlined from _index, as this is the hottest lookup
+        x, z = p
+        x -= self.origin.x
+        z -= self.origin.z
+        if 0 <= x < self.width and 0 <= z < self.height:
+            index = z * self.width + x
+            if self.present is None or self.present[index]:
+                return self.values[index]
+        return None
+
+    @property
+    def bounds(self) -> tuple[Point, Point]:
+        return self.origin, Point(
+            self.origin.x + self.width - 1, self.origin.z + self.height - 1
+        )
+
+
+def adjacent_points(point: Point) -> list[Point]:
+    x, z = point
+    return [Point(x + dx, z + dz) for dx, dz in ULDR]
 
 
 def get_adjacent_values(grid: IntGrid, point: Point) -> list[int]:
-    return [h for p in ULDR if (h := grid.get(point + p)) is not None]
+    return [h for p in adjacent_points(point) if (h := grid.get(p)) is not None]
 
 
 def adjacent_points_and_values(grid: IntGrid, point: Point) -> list[tuple[Point, int]]:
-    return [(point + p, h) for p in ULDR if (h := grid.get(point + p)) is not None]
+    return [(p, h) for p in adjacent_points(point) if (h := grid.get(p)) is not None]
+
+
+def read_ints(f: IO, use_mmap: bool = False, typecode: str = "q") -> array:
+    """
+    Reads the rest of a file of newline or comma separated integers into an array
+    in one go. With use_mmap, the file is parsed a chunk at a time through a memory
+    map rather than read in, so only the resulting array is held in memory.
+    """
+    if use_mmap:
+        return _read_mapped_ints(f, typecode)
+
+    # Skip decoding text files, as int() accepts bytes, unless some has been read
+    # already, when the buffer has read ahead of the text
+    buffer = getattr(f, "buffer", None)
+    data = buffer.read() if buffer is not None and f.tell() == 0 else f.read()
+    if isinstance(data, bytes):
+        return array(typecode, map(int, data.replace(b",", b" ").split()))
+    return array(typecode, map(int, data.replace(",", " ").split()))
+
+
+def _read_mapped_ints(f: IO, typecode: str) -> array:
+    ints = array(typecode)
+    offset = f.tell()
+    size = os.fstat(f.fileno()).st_size
+    if offset >= size:
+        return ints
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        partial = b""
+        for start in range(offset, size, _MMAP_CHUNK):
+            chunk = partial + mapped[start : start + _MMAP_CHUNK]
+            tokens = chunk.replace(b",", b" ").split()
+            # A chunk ending mid number leaves the rest of it to the next chunk
+            partial = b""
+            if start + _MMAP_CHUNK < size and tokens and chunk[-1:] not in _SEPARATORS:
+                partial = tokens.pop()
+            ints.extend(map(int, tokens))
+    # Leave the file read to the end, as reading it would
+    f.seek(0, os.SEEK_END)
+    return ints
+
+
+def chunk_boundaries(path: str, chunks: int) -> list[int]:
+    """Offsets splitting the file into about equal chunks, each starting a line"""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as f:
+        for i in range(1, chunks):
+            f.seek(max(size * i // chunks - 1, boundaries[-1]))
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+    boundaries.append(size)
+    return boundaries
+
+
+def read_chunk_lines(f: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """The lines of a file opened in binary mode from offset start up to end"""
+    f.seek(start)
+    while start < end:
+        line = f.readline()
+        if not line:
+            return
+        start += len(line)
+        yield line
+
+
+T = TypeVar("T")
+
+# Parsed inputs are pickled here, so later runs can skip parsing entirely
+INPUT_CACHE_DIR = ".input_cache"
+
+# Bump to invalidate every pickled input, such as when what gets pickled changes
+# in a way the sources alone would not show
+INPUT_CACHE_VERSION = 1
+
+_input_cache: dict[tuple, bytes] = {}
+
+# Set by bypass_input_cache
+_parse_every_time = False
+
+
+@functools.lru_cache(maxsize=None)
+def _sources_digest() -> str:
+    """
+    Hash of every module under solutions, as a parser can call into any of them,
+    and pickled inputs hold their classes. Taken once, as the modules already
+    imported are the ones that will parse.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1()
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, root).encode())
+                with open(path, "rb") as f:
+                    digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+def _sidecar_path(path: str, parse: Callable) -> str:
+    with open(path, "rb") as f:
+        contents = hashlib.sha1(f.read()).hexdigest()
+    key = (
+        contents,
+        parse.__module__,
+        parse.__qualname__,
+        _sources_digest(),
+        INPUT_CACHE_VERSION,
+    )
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    return os.path.join(INPUT_CACHE_DIR, f"{digest}.pickle")
+
+
+def _load_pickled_input(path: str, parse: Callable[[TextIO], T]) -> bytes:
+    sidecar = _sidecar_path(path, parse)
+    try:
+        with open(sidecar, "rb") as f:
+            data = f.read()
+        pickle.loads(data)
+        return data
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        AttributeError,
+        EOFError,
+        ImportError,
+        TypeError,
+        ValueError,
+    ):
+        pass
+
+    with open(path) as f:
+        data = pickle.dumps(parse(f), protocol=pickle.HIGHEST_PROTOCOL)
+    os.makedirs(INPUT_CACHE_DIR, exist_ok=True)
+    # Written under a temporary name first, as other processes may be reading it
+    temporary = f"{sidecar}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, sidecar)
+    return data
+
+
+def load_input(path: str, parse: Callable[[TextIO], T]) -> T:
+    """
+    Parses the file at path with parse only once per process, and once overall
+    while the file's contents and the solutions modules are unchanged. Every call
+    returns a new copy, so parts can modify what they are given.
+    """
+    if _parse_every_time:
+        with open(path) as f:
+            return parse(f)
+
+    stat = os.stat(path)
+    key = (
+        os.path.abspath(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        parse.__module__,
+        parse.__qualname__,
+    )
+    data = _input_cache.get(key)
+    if data is None:
+        data = _load_pickled_input(path, parse)
+        _input_cache[key] = data
+    return pickle.loads(data)
+
+
+def clear_input_cache():
+    """Forgets inputs parsed by this process, leaving those pickled on disk"""
+    _input_cache.clear()
+
+
+@contextlib.contextmanager
+def bypass_input_cache() -> Iterator[None]:
+    """
+    Within this, load_input parses the file on every call without reading or
+    writing any cache, so profiles include the parsing
+    """
+    global _parse_every_time
+    previous, _parse_every_time = _parse_every_time, True
+    try:
+        yield
+    finally:
+        _parse_every_time = previous
@@ -0,0 +1,10 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """size depths, wandering mostly deeper"""
+    depth = rng.randint(100, 200)
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 15))
+        f.write(f"{depth}\n")
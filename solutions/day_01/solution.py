@@ -1,39 +1,53 @@
-from typing import Iterator, TextIO
+import itertools
+import operator
+from collections import deque
+from typing import IO, Iterable, Iterator, Sequence
+
+from solutions.common import load_input, read_ints
 
 FILE = "solutions/day_01/input.txt"
 
 
-def yield_window_on_file(file: TextIO, length: int) -> Iterator[tuple[int, ...]]:
-    buffer: list[int] = []
-    for line in file:
-        value = int(line.rstrip())
+def read_depths(file: IO) -> Iterator[int]:
+    """Depths from a text or binary file, such as stdin, one line at a time"""
+    return (int(line) for line in file if not line.isspace())
+
+
+def yield_window(depths: Iterable[int], length: int) -> Iterator[tuple[int, ...]]:
+    buffer: deque[int] = deque(maxlen=length)
+    for value in depths:
         buffer.append(value)
-        if len(buffer) < length:
-            continue
-        yield tuple(buffer)
-        buffer.pop(0)
+        if len(buffer) == length:
+            yield tuple(buffer)
+
+
+def count_increases(depths: Iterable[int], window: int = 1) -> int:
+    """
+    How many sums of window consecutive depths are larger than the sum before, in
+    one pass holding only window depths. Neighbouring windows share all but one
+    depth at each end, so the sums differ by the depth entering less the one leaving.
+    """
+    depths = iter(depths)
+    buffer = deque(itertools.islice(depths, window), maxlen=window)
+    count = 0
+    for value in depths:
+        if value > buffer[0]:
+            count += 1
+        buffer.append(value)
+    return count
+
+
+def count_increases_in_memory(depths: Sequence[int], window: int = 1) -> int:
+    """As count_increases, comparing all the depths in one go when they fit in memory"""
+    return sum(map(operator.gt, itertools.islice(depths, window, None), depths))
 
 
 def solve_part_a() -> int:
-    depth_increase_count = 0
-    with open(FILE) as f:
-        for first, second in yield_window_on_file(f, 2):
-            if second > first:
-                depth_increase_count += 1
-    return depth_increase_count
+    return count_increases_in_memory(load_input(FILE, read_ints), 1)
 
 
 def solve_part_b() -> int:
-    depth_increase_count = 0
-    with open(FILE) as f, open(FILE) as g:
-        # Offset second file by 1
-        next(g)
-        for first, second in zip(
-            yield_window_on_file(f, 3), yield_window_on_file(g, 3)
-        ):
-            if sum(second) > sum(first):
-                depth_increase_count += 1
-    return depth_increase_count
+    return count_increases_in_memory(load_input(FILE, read_ints), 3)
 
 
 def run():
@@ -0,0 +1,31 @@
+import io
+from array import array
+
+import pytest
+
+from solutions.day_01.solution import (
+    count_increases,
+    count_increases_in_memory,
+    read_depths,
+    yield_window,
+)
+
+DEPTHS = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+
+
+@pytest.mark.parametrize("window,count", [(1, 7), (3, 5), (10, 0), (11, 0)])
+def test_count_increases(window, count):
+    assert count_increases(DEPTHS, window) == count
+    assert count_increases_in_memory(array("q", DEPTHS), window) == count
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 4])
+def test_count_increases_matches_window_sums(window):
+    sums = [sum(w) for w in yield_window(DEPTHS, window)]
+    expected = sum(b > a for a, b in zip(sums, sums[1:]))
+    assert count_increases(iter(DEPTHS), window) == expected
+
+
+def test_read_depths():
+    file = io.BytesIO(b"".join(b"%d\n" % d for d in DEPTHS) + b"\n")
+    assert count_increases(read_depths(file), 3) == 5
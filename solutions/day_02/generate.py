@@ -0,0 +1,16 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """size commands, keeping the submarine below the surface"""
+    depth = 0
+    for _ in range(size):
+        direction = rng.choice(("forward", "down", "up"))
+        length = rng.randint(1, 9)
+        if direction == "up":
+            length = min(length, depth)
+            if length == 0:
+                direction, length = "down", rng.randint(1, 9)
+        depth += -length if direction == "up" else length
+        f.write(f"{direction} {length}\n")
@@ -1,79 +1,102 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Iterator, TextIO
+import functools
+import itertools
+import operator
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple, Optional, Sequence, TextIO
 
-from solutions.common import Point
+from solutions.common import chunk_boundaries, load_input, read_chunk_lines
 
+FILE = "solutions/day_02/input.txt"
 
-class Direction(Enum):
-    forward = auto()
-    up = auto()
-    down = auto()
+# How much each command changes the aim by, per unit of its length
+STEERING = {"forward": 0, "up": -1, "down": 1}
 
 
-@dataclass
-class Movement:
-    direction: Direction
-    length: int
+class Transform(NamedTuple):
+    """The change in aim, horizontal position and depth over a run of commands"""
 
-
-@dataclass
-class Ship:
-    location: Point = field(default_factory=Point)
     aim: int = 0
-
-    def move_ship(self, move: Movement):
-        match move.direction:
-            case Direction.up:
-                self.aim -= move.length
-            case Direction.down:
-                self.aim += move.length
-            case Direction.forward:
-                v = Point(move.length, move.length * self.aim)
-                self.location += v
-            case _:
-                raise ValueError
-
-
-DIRECTION_TO_VECTOR: dict[Direction, Point] = {
-    Direction.forward: Point(1, 0),
-    Direction.up: Point(0, -1),
-    Direction.down: Point(0, 1),
-}
-
-
-def movement_to_vector(move: Movement) -> Point:
-    dir_v = DIRECTION_TO_VECTOR[move.direction]
-    return dir_v * move.length
+    x: int = 0
+    depth: int = 0
+
+    def then(self, other: Transform) -> Transform:
+        # Moving forward in the later commands also descends by the aim built up here
+        return Transform(
+            self.aim + other.aim,
+            self.x + other.x,
+            self.depth + other.depth + self.aim * other.x,
+        )
+
+
+def reduce_lines(lines: Iterable[bytes]) -> Transform:
+    aim = x = depth = 0
+    for line in lines:
+        direction, _, length = line.partition(b" ")
+        if direction == b"forward":
+            x += int(length)
+            depth += aim * int(length)
+        elif direction == b"down":
+            aim += int(length)
+        elif direction == b"up":
+            aim -= int(length)
+        elif line.strip():
+            raise ValueError(f"Unknown command {line!r}")
+    return Transform(aim, x, depth)
+
+
+def reduce_chunk(path: str, start: int, end: int) -> Transform:
+    with open(path, "rb") as f:
+        return reduce_lines(read_chunk_lines(f, start, end))
+
+
+def reduce_file(path: str, workers: Optional[int] = None) -> Transform:
+    """
+    Reduces the commands in a file too large to hold in memory, splitting it into
+    a chunk per worker process and combining their transforms in order.
+    """
+    workers = workers or os.cpu_count() or 1
+    boundaries = chunk_boundaries(path, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        transforms = executor.map(
+            reduce_chunk, itertools.repeat(path), boundaries, boundaries[1:]
+        )
+        return functools.reduce(Transform.then, transforms, Transform())
+
+
+def parse_commands(f: TextIO) -> tuple[array, array]:
+    """The change in aim and the distance forward of each command"""
+    steering = array("q")
+    forward = array("q")
+    for line in f:
+        direction, length = line.split()
+        steering.append(STEERING[direction] * int(length))
+        forward.append(0 if STEERING[direction] else int(length))
+    return steering, forward
 
 
-def movements_from_file(f: TextIO) -> Iterator[Movement]:
-    for line in f:
-        d, l = line.split()
-        direction = Direction[d]
-        length = int(l)
-        yield Movement(direction, length)
+def summarise(steering: Sequence[int], forward: Sequence[int]) -> Transform:
+    """Reduces commands held in memory using the running total of the aim"""
+    aims = list(itertools.accumulate(steering))
+    return Transform(
+        aims[-1] if aims else 0,
+        sum(forward),
+        sum(map(operator.mul, aims, forward)),
+    )
 
 
 def solve_part_a() -> int:
-    location = Point(0, 0)
-    with open("solutions/day_02/input.txt") as f:
-        for m in movements_from_file(f):
-            v = movement_to_vector(m)
-            location += v
-
-    return location.x * location.z
+    # Without the aim, down and up change the depth directly
+    total = summarise(*load_input(FILE, parse_commands))
+    return total.x * total.aim
 
 
 def solve_part_b() -> int:
-    ship = Ship()
-    with open("solutions/day_02/input.txt") as f:
-        for m in movements_from_file(f):
-            ship.move_ship(m)
-
-    return ship.location.x * ship.location.z
+    total = summarise(*load_input(FILE, parse_commands))
+    return total.x * total.depth
 
 
 def run():
@@ -0,0 +1,40 @@
+import io
+import random
+
+import pytest
+
+from solutions.common import chunk_boundaries
+from solutions.day_02.generate import generate
+from solutions.day_02.solution import (
+    Transform,
+    parse_commands,
+    reduce_file,
+    reduce_lines,
+    summarise,
+)
+
+COMMANDS = "forward 5\ndown 5\nforward 8\nup 3\ndown 8\nforward 2\n"
+
+
+def test_summarise():
+    total = summarise(*parse_commands(io.StringIO(COMMANDS)))
+    assert total == Transform(aim=10, x=15, depth=60)
+
+
+def test_then_matches_reducing_all_lines():
+    lines = COMMANDS.encode().splitlines()
+    for split in range(len(lines) + 1):
+        first, second = reduce_lines(lines[:split]), reduce_lines(lines[split:])
+        assert first.then(second) == reduce_lines(lines)
+
+
+@pytest.mark.parametrize("workers", [1, 3, 8])
+def test_reduce_file(tmp_path, workers):
+    path = tmp_path / "input.txt"
+    with open(path, "w") as f:
+        generate(f, 500, random.Random(2))
+    with open(path) as f:
+        expected = summarise(*parse_commands(f))
+
+    assert len(chunk_boundaries(str(path), workers)) == workers + 1
+    assert reduce_file(str(path), workers) == expected
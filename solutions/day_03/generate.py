@@ -0,0 +1,12 @@
+import random
+from typing import TextIO
+
+# Fewest bits in a report, with more added when size needs them
+BITS = 12
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """size distinct reports of 12 bits each, or as many more as they need"""
+    bits = max(BITS, size.bit_length())
+    for report in rng.sample(range(2**bits), size):
+        f.write(f"{report:0{bits}b}\n")
@@ -1,77 +1,64 @@
-import copy
-from collections import defaultdict
-from typing import Iterable, Iterator, Sequence, TextIO
+from array import array
+from bisect import bisect_left
+from typing import Sequence, TextIO
+
+from solutions.common import load_input
 
 FILE = "solutions/day_03/input.txt"
 TEST_FILE = "solutions/day_03/test_input.txt"
 
 
-def iterate_byte_tuples(f: TextIO) -> Iterator[tuple[int, ...]]:
-    for line in f:
-        yield tuple(int(x) for x in line.strip())
+def parse_reports(f: TextIO) -> tuple[int, array]:
+    """The number of bits in each report, and the reports as sorted ints"""
+    lines = f.read().split()
+    return len(lines[0]), array("q", sorted(int(line, 2) for line in lines))
+
+
+def count_ones(reports: Sequence[int], width: int) -> list[int]:
+    """How many reports have each bit set, from the most significant"""
+    return [
+        sum(map((1 << bit).__and__, reports)) >> bit for bit in reversed(range(width))
+    ]
 
 
-def byte_sequence_to_int(byte_tuple: Sequence[int]) -> int:
-    string_tuple = [str(b) for b in byte_tuple]
-    return int("".join(string_tuple), 2)
+def calculate_gamma_epsilon(reports: Sequence[int], width: int) -> tuple[int, int]:
+    gamma = 0
+    for count in count_ones(reports, width):
+        gamma = gamma << 1 | (count * 2 > len(reports))
+    return gamma, ~gamma & ((1 << width) - 1)
 
 
-def convert_counts_to_gamma_epsilon(
-    counts: defaultdict[int, int], total: int
-) -> tuple[int, int]:
-    gamma_bits = []
-    epsilon_bits = []
-    half_count = total // 2
-    for i in range(len(counts)):
-        count = counts[i]
-        gamma_bits.append(1 if count > half_count else 0)
-        epsilon_bits.append(0 if count > half_count else 1)
-    return byte_sequence_to_int(gamma_bits), byte_sequence_to_int(epsilon_bits)
+def find_rating(reports: Sequence[int], width: int, most_common: bool) -> int:
+    """
+    Narrows the sorted reports bit by bit to those sharing a prefix, which are
+    always a contiguous range, so each bit takes one binary search and no copying.
+    """
+    low, high = 0, len(reports)
+    for bit in reversed(range(width)):
+        if high - low == 1:
+            break
+        # The first report in the range with this bit set, after the shared prefix
+        prefix = reports[low] >> (bit + 1) << (bit + 1)
+        split = bisect_left(reports, prefix | 1 << bit, low, high)
+        ones, zeros = high - split, split - low
+        keep_ones = ones >= zeros if most_common else ones < zeros
+        if keep_ones and ones or not zeros:
+            low = split
+        else:
+            high = split
+    return reports[low]
 
 
 def solve_part_a():
-    counts = defaultdict(int)
-    with open(FILE) as f:
-        for i, byte_tuple in enumerate(iterate_byte_tuples(f), 1):
-            for j, bit in enumerate(byte_tuple):
-                counts[j] += bit
-    gamma, episilon = convert_counts_to_gamma_epsilon(counts, i)
-    return gamma * episilon
-
-
-def sum_bits_in_position(pos: int, byte_tuples: Iterable[tuple[int, ...]]) -> int:
-    return sum(bt[pos] for bt in byte_tuples)
-
-
-def calculate_oxygen(byte_tuples: Sequence[tuple[int, ...]]) -> int:
-    pos = 0
-    bts = copy.copy(byte_tuples)
-    while (remaining := len(bts)) > 1:
-        sum = sum_bits_in_position(pos, bts)
-        winner = 1 if sum * 2 >= remaining else 0
-        bts = [bt for bt in bts if bt[pos] == winner]
-        pos += 1
-    [result] = bts
-    return byte_sequence_to_int(result)
-
-
-def calculate_co2(byte_tuples: Sequence[tuple[int, ...]]) -> int:
-    pos = 0
-    bts = copy.copy(byte_tuples)
-    while (remaining := len(bts)) > 1:
-        sum = sum_bits_in_position(pos, bts)
-        winner = 0 if sum * 2 >= remaining else 1
-        bts = [bt for bt in bts if bt[pos] == winner]
-        pos += 1
-    [result] = bts
-    return byte_sequence_to_int(result)
+    width, reports = load_input(FILE, parse_reports)
+    gamma, epsilon = calculate_gamma_epsilon(reports, width)
+    return gamma * epsilon
 
 
 def solve_part_b():
-    with open(FILE) as f:
-        byte_tuples = list(iterate_byte_tuples(f))
-    oxygen = calculate_oxygen(byte_tuples)
-    co2 = calculate_co2(byte_tuples)
+    width, reports = load_input(FILE, parse_reports)
+    oxygen = find_rating(reports, width, most_common=True)
+    co2 = find_rating(reports, width, most_common=False)
     return oxygen * co2
 
 
@@ -0,0 +1,19 @@
+from solutions.day_03.solution import (
+    TEST_FILE,
+    calculate_gamma_epsilon,
+    find_rating,
+    parse_reports,
+)
+
+
+def test_gamma_epsilon():
+    with open(TEST_FILE) as f:
+        width, reports = parse_reports(f)
+    assert calculate_gamma_epsilon(reports, width) == (22, 9)
+
+
+def test_find_rating():
+    with open(TEST_FILE) as f:
+        width, reports = parse_reports(f)
+    assert find_rating(reports, width, most_common=True) == 23
+    assert find_rating(reports, width, most_common=False) == 10
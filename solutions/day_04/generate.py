@@ -0,0 +1,19 @@
+import random
+from typing import TextIO
+
+NUMBERS = 100
+BOARD_SIZE = 5
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """All the numbers called in a random order, then size boards"""
+    calls = list(range(NUMBERS))
+    rng.shuffle(calls)
+    f.write(",".join(str(c) for c in calls) + "\n\n")
+    for _ in range(size):
+        numbers = rng.sample(range(NUMBERS), BOARD_SIZE * BOARD_SIZE)
+        for row in range(BOARD_SIZE):
+            line = numbers[row * BOARD_SIZE : (row + 1) * BOARD_SIZE]
+            f.write(" ".join(f"{n:2}" for n in line) + "\n")
+        # Boards are only parsed once followed by an empty line
+        f.write("\n")
@@ -1,6 +1,7 @@
-import copy
 from collections import Counter
-from typing import Optional, TextIO
+from typing import Iterable, Iterator, NamedTuple, Optional, TextIO
+
+from solutions.common import load_input
 
 Calls = list[int]
 RawBoard = list[list[int]]
@@ -54,49 +55,90 @@ class Board:
         return sum(unchecked_numbers) * self._last_called
 
 
-def parse_bingo_file(f: TextIO) -> tuple[Calls, list[Board]]:
-    calls_str = f.readline().rstrip()
-    calls = [int(n) for n in calls_str.split(",")]
+class BoardWin(NamedTuple):
+    turn: int
+    score: int
+
+
+def read_calls(f: TextIO) -> Calls:
+    calls = [int(n) for n in f.readline().split(",")]
     # Skip empty line
     next(f)
+    return calls
+
 
-    raw_boards: list[RawBoard] = []
+def iterate_raw_boards(f: TextIO) -> Iterator[RawBoard]:
+    """Boards one at a time, so inputs with millions of them are never all held"""
     board: RawBoard = []
     for line in f:
-        if not line.rstrip():
-            raw_boards.append(copy.copy(board))
-            board.clear()
-            continue
-        b_line = [int(x) for x in line.split()]
-        board.append(b_line)
+        if line.strip():
+            board.append([int(x) for x in line.split()])
+        elif board:
+            yield board
+            board = []
+    if board:
+        yield board
 
-    boards = [Board(raw_board) for raw_board in raw_boards]
 
+def parse_raw_bingo_file(f: TextIO) -> tuple[Calls, list[RawBoard]]:
+    return read_calls(f), list(iterate_raw_boards(f))
+
+
+def parse_bingo_file(f: TextIO) -> tuple[Calls, list[Board]]:
+    calls = read_calls(f)
+    boards = [Board(raw_board) for raw_board in iterate_raw_boards(f)]
     return calls, boards
 
 
+def find_win(
+    turns: dict[int, int], raw_board: RawBoard, calls: Calls
+) -> Optional[BoardWin]:
+    """
+    A board wins on the turn its first line is complete, which is the turn the
+    last number of that line is called
+    """
+    never = len(calls)
+    board_turns = [[turns.get(n, never) for n in row] for row in raw_board]
+    turn = min(
+        min(max(row) for row in board_turns),
+        min(max(column) for column in zip(*board_turns)),
+    )
+    if turn == never:
+        return None
+    unmarked = sum(
+        n
+        for row, row_turns in zip(raw_board, board_turns)
+        for n, t in zip(row, row_turns)
+        if t > turn
+    )
+    return BoardWin(turn, unmarked * calls[turn])
+
+
+def rank_boards(calls: Calls, raw_boards: Iterable[RawBoard]) -> list[BoardWin]:
+    """
+    The win of every board that wins, in the order they happen, with ties in the
+    order of the boards. The nth board to win is then just the nth in the list.
+    Boards are only looked at once, so they can be streamed from a file with
+    iterate_raw_boards.
+    """
+    # The first call of a number is the one that marks it
+    turns = {n: turn for turn, n in reversed(list(enumerate(calls)))}
+    wins = (find_win(turns, raw_board, calls) for raw_board in raw_boards)
+    return sorted((w for w in wins if w is not None), key=lambda w: w.turn)
+
+
 def solve_part_a() -> int:
-    with open(FILE) as f:
-        calls, boards = parse_bingo_file(f)
-    for call in calls:
-        for board in boards:
-            win = board.check_number(call)
-            if win is not None:
-                return win
-    raise ValueError("No boards won")
+    wins = rank_boards(*load_input(FILE, parse_raw_bingo_file))
+    if not wins:
+        raise ValueError("No boards won")
+    return wins[0].score
 
 
 def solve_part_b() -> int:
-    with open(FILE) as f:
-        calls, boards = parse_bingo_file(f)
-
-    last_win = None
-    for call in calls:
-        for board in boards:
-            win = board.check_number(call)
-            if win is not None:
-                last_win = win
-    return last_win
+    wins = rank_boards(*load_input(FILE, parse_raw_bingo_file))
+    if not wins:
+        raise ValueError("No boards won")
+    return wins[-1].score
 
 
 def run():
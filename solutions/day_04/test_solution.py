@@ -1,6 +1,10 @@
+import io
+import random
+
 import pytest
 
 from solutions.day_04 import solution
+from solutions.day_04.generate import generate
 
 BOARD = [
     [1, 4, 9],
@@ -35,3 +39,28 @@ def test_check_win(calls, win_value):
         board.check_number(call)
 
     assert board._check_win() == win_value
+
+
+def test_rank_boards_matches_checking_numbers():
+    f = io.StringIO()
+    generate(f, 50, random.Random(3))
+    f.seek(0)
+    calls, boards = solution.parse_bingo_file(f)
+    expected = []
+    for turn, call in enumerate(calls):
+        for board in boards:
+            win = board.check_number(call)
+            if win is not None:
+                expected.append(solution.BoardWin(turn, win))
+
+    f.seek(0)
+    calls = solution.read_calls(f)
+    assert solution.rank_boards(calls, solution.iterate_raw_boards(f)) == expected
+
+
+def test_last_board_without_trailing_line():
+    f = io.StringIO("1,2\n\n1 2\n3 4\n\n2 1\n4 3")
+    assert solution.rank_boards(*solution.parse_raw_bingo_file(f)) == [
+        solution.BoardWin(1, 7 * 2),
+        solution.BoardWin(1, 7 * 2),
+    ]
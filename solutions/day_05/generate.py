@@ -0,0 +1,25 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """
+    size horizontal, vertical and diagonal vents, on a square sheet growing with
+    the number of vents
+    """
+    extent = max(10, int(size**0.5 * 30))
+    for _ in range(size):
+        sx = rng.randrange(extent)
+        sz = rng.randrange(extent)
+        length = rng.randint(1, extent // 2)
+        dx, dz = rng.choice(
+            ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+        )
+        # Shorten the vent until it ends on the sheet
+        length = min(
+            length,
+            *(extent - 1 - s if d > 0 else s for s, d in ((sx, dx), (sz, dz)) if d),
+        )
+        if length == 0:
+            dx, dz, length = (1 if sx == 0 else -1), 0, 1
+        f.write(f"{sx},{sz} -> {sx + dx * length},{sz + dz * length}\n")
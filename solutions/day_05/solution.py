@@ -1,12 +1,13 @@
+import bisect
 import copy
 import itertools
-from collections import Counter
+import math
+from collections import defaultdict
 from dataclasses import dataclass
 from fractions import Fraction
-from os import pipe
-from typing import Iterator, TextIO
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence, TextIO
 
-from solutions.common import Point
+from solutions.common import Point, load_input
 
 FILE = "solutions/day_05/input.txt"
 TEST_FILE = "solutions/day_05/test_input.txt"
@@ -63,19 +64,170 @@ def yield_pipes_from_file(f: TextIO) -> Iterator[Pipe]:
         yield Pipe(Point(sx, sy), Point(ex, ey))
 
 
+def parse_pipes(f: TextIO) -> list[Pipe]:
+    return list(yield_pipes_from_file(f))
+
+
+# Cells at most this many are counted in one array, otherwise a row at a time
+MAX_DENSE_CELLS = 1 << 24
+
+# Adds a pipe to the count of pipes over a cell, which stops at 2 as no more matter
+_COVER = bytes([1] + [2] * 255)
+
+
+def is_diagonal(pipe: Pipe) -> bool:
+    return pipe.start.x != pipe.end.x and pipe.start.z != pipe.end.z
+
+
+def _steps(pipe: Pipe) -> tuple[int, int, int]:
+    """The x and z of each step between the pipe's points, and how many steps"""
+    dx, dz = pipe.end.x - pipe.start.x, pipe.end.z - pipe.start.z
+    steps = math.gcd(dx, dz)
+    if steps == 0:
+        return 0, 0, 0
+    return dx // steps, dz // steps, steps
+
+
+def count_overlaps_dense(pipes: Sequence[Pipe]) -> int:
+    """
+    Counts points covered by at least two pipes in a flat array over the pipes'
+    bounding box. The points of a pipe are evenly spaced in the array, so each
+    pipe is added with one translate of an extended slice.
+    """
+    if not pipes:
+        return 0
+    min_x = min(min(p.start.x, p.end.x) for p in pipes)
+    min_z = min(min(p.start.z, p.end.z) for p in pipes)
+    width = max(max(p.start.x, p.end.x) for p in pipes) - min_x + 1
+    height = max(max(p.start.z, p.end.z) for p in pipes) - min_z + 1
+
+    counts = bytearray(width * height)
+    for pipe in pipes:
+        step_x, step_z, steps = _steps(pipe)
+        start = (pipe.start.z - min_z) * width + pipe.start.x - min_x
+        end = (pipe.end.z - min_z) * width + pipe.end.x - min_x
+        step = step_z * width + step_x
+        if step < 0:
+            start, end, step = end, start, -step
+        cells = slice(start, end + 1, step or 1)
+        counts[cells] = counts[cells].translate(_COVER)
+    return counts.count(2)
+
+
+def _covered_twice(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """The inclusive spans covered by at least two of the inclusive intervals"""
+    changes = sorted(
+        itertools.chain.from_iterable(((a, 1), (b + 1, -1)) for a, b in intervals)
+    )
+    spans = []
+    depth = begin = 0
+    for x, change in changes:
+        was, depth = depth, depth + change
+        if was < 2 <= depth:
+            begin = x
+        elif depth < 2 <= was:
+            spans.append((begin, x - 1))
+    return spans
+
+
+def _within(spans: list[tuple[int, int]], position: int) -> bool:
+    i = bisect.bisect_right(spans, (position, math.inf)) - 1
+    return i >= 0 and spans[i][1] >= position
+
+
+class _Segment(NamedTuple):
+    """
+    A pipe as its first point and the step between its points, always down the
+    sheet or along a row to the right, and the line it is on
+    """
+
+    start: Point
+    step_x: int
+    step_z: int
+    steps: int
+    line: tuple[int, int, int]
+
+    @classmethod
+    def from_pipe(cls, pipe: Pipe) -> "_Segment":
+        step_x, step_z, steps = _steps(pipe)
+        start = pipe.start
+        if steps == 0:
+            step_x = 1
+        elif step_z < 0 or step_z == 0 and step_x < 0:
+            start, step_x, step_z = pipe.end, -step_x, -step_z
+        line = (step_x, step_z, step_x * start.z - step_z * start.x)
+        return cls(start, step_x, step_z, steps, line)
+
+    @property
+    def last_z(self) -> int:
+        return self.start.z + self.steps * self.step_z
+
+    def position(self, point: Point) -> int:
+        """How many steps along the line a point on it is, from a fixed origin"""
+        return point.x // self.step_x if self.step_x else point.z
+
+    def crossing(self, other: "_Segment") -> Optional[Point]:
+        """The point both segments are on, if they are on different lines"""
+        det = other.step_x * self.step_z - self.step_x * other.step_z
+        if det == 0:
+            return None
+        dx, dz = other.start.x - self.start.x, other.start.z - self.start.z
+        t, t_off = divmod(other.step_x * dz - other.step_z * dx, det)
+        u, u_off = divmod(self.step_x * dz - self.step_z * dx, det)
+        if t_off or u_off or not (0 <= t <= self.steps and 0 <= u <= other.steps):
+            return None
+        return Point(self.start.x + t * self.step_x, self.start.z + t * self.step_z)
+
+
+def count_overlaps_sweep(pipes: Iterable[Pipe]) -> int:
+    """
+    Counts points covered by at least two pipes from the pipes' ends alone, so the
+    cost does not grow with their length. Pipes on the same line overlap in
+    intervals along it. Pipes on different lines meet in at most one point, found
+    by intersecting each pipe with those still active when a sweep down the sheet
+    reaches its first row.
+    """
+    segments = sorted((_Segment.from_pipe(p) for p in pipes), key=lambda s: s.start.z)
+
+    along: defaultdict[tuple[int, int, int], list[tuple[int, int]]] = defaultdict(list)
+    for segment in segments:
+        first = segment.position(segment.start)
+        along[segment.line].append((first, first + segment.steps))
+    twice = {line: _covered_twice(intervals) for line, intervals in along.items()}
+    overlaps = sum(end - start + 1 for spans in twice.values() for start, end in spans)
+
+    # A pipe on each line through each point where pipes cross
+    crossings: defaultdict[Point, dict[tuple[int, int, int], _Segment]]
+    crossings = defaultdict(dict)
+    active: list[_Segment] = []
+    for segment in segments:
+        active = [a for a in active if a.last_z >= segment.start.z]
+        for other in active:
+            point = segment.crossing(other)
+            if point is not None:
+                crossings[point][segment.line] = segment
+                crossings[point][other.line] = other
+        active.append(segment)
+
+    # Each crossing counts once, less the times it was counted in an overlap along
+    # one of the lines through it
+    return overlaps + sum(
+        1 - sum(_within(twice[line], s.position(point)) for line, s in crossed.items())
+        for point, crossed in crossings.items()
+    )
+
+
+def count_overlaps(pipes: Iterable[Pipe], include_diagonal: bool = False) -> int:
+    pipes = [p for p in pipes if include_diagonal or not is_diagonal(p)]
+    xs = [x for p in pipes for x in (p.start.x, p.end.x)]
+    zs = [z for p in pipes for z in (p.start.z, p.end.z)]
+    if pipes and (max(xs) - min(xs) + 1) * (max(zs) - min(zs) + 1) > MAX_DENSE_CELLS:
+        return count_overlaps_sweep(pipes)
+    return count_overlaps_dense(pipes)
+
+
 def solve_part_a(diag: bool = False) -> int:
-    with open(FILE) as f:
-        all_points = itertools.chain.from_iterable(
-            p.points(include_diagonal=diag) for p in yield_pipes_from_file(f)
-        )
-        pipe_counter = Counter(all_points)
-
-    crossing_points = 0
-    for _, count in pipe_counter.most_common():
-        if count == 1:
-            break
-        crossing_points += 1
-    return crossing_points
+    return count_overlaps(load_input(FILE, parse_pipes), include_diagonal=diag)
 
 
 def solve_part_b() -> int:
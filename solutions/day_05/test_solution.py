@@ -1,6 +1,16 @@
+import random
+
 import pytest
 
-from solutions.day_05.solution import Pipe, Point
+from solutions.day_05.solution import (
+    TEST_FILE,
+    Pipe,
+    Point,
+    count_overlaps_dense,
+    count_overlaps_sweep,
+    is_diagonal,
+    parse_pipes,
+)
 
 
 @pytest.mark.parametrize(
@@ -16,3 +26,49 @@ from solutions.day_05.solution import Pipe, Point
 )
 def test_points(pipe, points):
     assert list(pipe.points(include_diagonal=True)) == points
+
+
+@pytest.mark.parametrize("count_overlaps", [count_overlaps_dense, count_overlaps_sweep])
+@pytest.mark.parametrize("include_diagonal,overlaps", [(False, 5), (True, 12)])
+def test_count_overlaps(count_overlaps, include_diagonal, overlaps):
+    with open(TEST_FILE) as f:
+        pipes = [p for p in parse_pipes(f) if include_diagonal or not is_diagonal(p)]
+    assert count_overlaps(pipes) == overlaps
+
+
+@pytest.mark.parametrize("count_overlaps", [count_overlaps_dense, count_overlaps_sweep])
+def test_count_overlaps_steep_pipes(count_overlaps):
+    pipes = [
+        Pipe(Point(0, 0), Point(2, 4)),
+        Pipe(Point(1, 4), Point(1, 0)),
+        Pipe(Point(3, 2), Point(0, 2)),
+        Pipe(Point(5, 5), Point(5, 5)),
+        Pipe(Point(5, 5), Point(6, 6)),
+    ]
+    # (1, 2) is on the first three, (2, 4) on none but the first, and (5, 5) twice
+    assert count_overlaps(pipes) == 2
+
+
+def test_sweep_matches_dense():
+    rng = random.Random(5)
+    for _ in range(500):
+        pipes = []
+        for _ in range(rng.randint(1, 9)):
+            start = Point(rng.randint(0, 8), rng.randint(0, 8))
+            dx, dz = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1), (2, 1), (1, -3)])
+            length = rng.randint(0, 4)
+            end = Point(start.x + dx * length, start.z + dz * length)
+            pipes.append(Pipe(*rng.sample([start, end], 2)))
+        assert count_overlaps_sweep(pipes) == count_overlaps_dense(pipes)
+
+
+def test_sweep_does_not_walk_long_pipes():
+    pipes = [
+        Pipe(Point(0, 0), Point(0, 2_000_000)),
+        Pipe(Point(0, 3_000_000), Point(0, 1_000_000)),
+        Pipe(Point(2_500_000, 0), Point(0, 2_500_000)),
+        Pipe(Point(-5_000_000, 1_500_000), Point(5_000_000, 1_500_000)),
+    ]
+    # The two columns overlap on a million and one rows, and the diagonal crosses
+    # the second column and the row once each away from that
+    assert count_overlaps_sweep(pipes) == 1_000_003
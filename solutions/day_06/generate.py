@@ -0,0 +1,7 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """size lanternfish, with timers from 1 to 5"""
+    f.write(",".join(str(rng.randint(1, 5)) for _ in range(size)) + "\n")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import operator
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, Optional, TextIO
 
+from solutions.common import load_input, read_ints
+
 FILE = "solutions/day_06/input.txt"
 TEST_FILE = "solutions/day_06/test_input.txt"
 
@@ -23,31 +27,95 @@ def parse_fish(f: TextIO) -> list[Fish]:
     return [Fish(int(n)) for n in fish_str.split(",")]
 
 
-def fish_at_day_n(n: int, fishes: Iterable[Fish]) -> int:
-    day = 0
-    fish_counts = Counter(fishes)
-    while day < n:
-        new_counts: Counter[Fish] = Counter()
-        for fish, count in fish_counts.items():
-            fish_updated, maybe_new_fish = fish.pass_time()
-            new_counts[fish_updated] += count
-            if maybe_new_fish is not None:
-                new_counts[maybe_new_fish] += count
-        fish_counts = new_counts
-        day += 1
-    return fish_counts.total()
+TIMERS = 9
+
+Matrix = tuple[tuple[int, ...], ...]
+
+# TRANSITION[i][j] is how many fish with timer j a fish with timer i becomes a
+# day later
+TRANSITION: Matrix = tuple(
+    tuple(
+        sum(f is not None and f.counter == j for f in Fish(i).pass_time())
+        for j in range(TIMERS)
+    )
+    for i in range(TIMERS)
+)
+
+
+def _multiply(a: Matrix, b: Matrix, modulus: Optional[int]) -> Matrix:
+    columns = list(zip(*b))
+    product = tuple(
+        tuple(sum(map(operator.mul, row, column)) for column in columns) for row in a
+    )
+    if modulus is None:
+        return product
+    return tuple(tuple(x % modulus for x in row) for row in product)
+
+
+@lru_cache(maxsize=None)
+def _transition_power(exponent: int, modulus: Optional[int]) -> Matrix:
+    """TRANSITION to the power of 2 ** exponent, shared by every horizon"""
+    if exponent == 0:
+        return TRANSITION
+    half = _transition_power(exponent - 1, modulus)
+    return _multiply(half, half, modulus)
+
+
+@lru_cache(maxsize=None)
+def contributions(n: int, modulus: Optional[int] = None) -> tuple[int, ...]:
+    """
+    How many fish there are after n days for each fish with timer t at the start,
+    by applying the cached squarings of TRANSITION for the bits of n, so it takes
+    O(log n) matrix products rather than n days.
+    """
+    table = (1,) * TIMERS
+    for exponent in range(n.bit_length()):
+        if n >> exponent & 1:
+            power = _transition_power(exponent, modulus)
+            table = tuple(sum(map(operator.mul, row, table)) for row in power)
+            if modulus is not None:
+                table = tuple(t % modulus for t in table)
+    return table
+
+
+def count_timers(timers: Iterable[int]) -> list[int]:
+    """How many fish have each timer, from the fishes' timers"""
+    counts = Counter(timers)
+    return [counts[t] for t in range(TIMERS)]
+
+
+def fish_at_days(
+    days: Iterable[int],
+    timers: Iterable[int],
+    modulus: Optional[int] = None,
+) -> list[int]:
+    """
+    The number of fish after each number of days, given the timer of each starting
+    fish, such as those from read_ints or the counters of Fish, counting them once.
+    Exact counts grow by about 9% a day, so give a modulus for horizons in the
+    millions of days and beyond.
+    """
+    counts = count_timers(timers)
+    totals = []
+    for n in days:
+        total = sum(map(operator.mul, contributions(n, modulus), counts))
+        totals.append(total if modulus is None else total % modulus)
+    return totals
+
+
+def fish_at_day_n(n: int, timers: Iterable[int], modulus: Optional[int] = None) -> int:
+    [total] = fish_at_days([n], timers, modulus)
+    return total
 
 
 def solve_part_a() -> int:
-    with open(FILE) as f:
-        fishes = parse_fish(f)
-    return fish_at_day_n(80, fishes)
+    timers = load_input(FILE, read_ints)
+    return fish_at_day_n(80, timers)
 
 
 def solve_part_b() -> int:
-    with open(FILE) as f:
-        fishes = parse_fish(f)
-    return fish_at_day_n(256, fishes)
+    timers = load_input(FILE, read_ints)
+    return fish_at_day_n(256, timers)
 
 
 def run():
@@ -0,0 +1,27 @@
+from solutions.common import read_ints
+from solutions.day_06.solution import (
+    TEST_FILE,
+    count_timers,
+    fish_at_day_n,
+    fish_at_days,
+    parse_fish,
+)
+
+
+def test_fish_at_days():
+    with open(TEST_FILE) as f:
+        timers = [fish.counter for fish in parse_fish(f)]
+    assert fish_at_days([0, 18, 80, 256], timers) == [5, 26, 5934, 26984457539]
+
+
+def test_fish_at_day_n_modulus():
+    with open(TEST_FILE) as f:
+        timers = [fish.counter for fish in parse_fish(f)]
+    modulus = 10**9 + 7
+    assert fish_at_day_n(1000, timers, modulus) == fish_at_day_n(1000, timers) % modulus
+
+
+def test_timers_from_read_ints():
+    with open(TEST_FILE) as f:
+        timers = read_ints(f)
+    assert count_timers(timers) == [0, 1, 1, 2, 1, 0, 0, 0, 0]
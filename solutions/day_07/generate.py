@@ -0,0 +1,9 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """size crabs, spread over positions up to roughly size"""
+    spread = max(size, 10)
+    positions = (int(rng.triangular(0, spread, spread / 4)) for _ in range(size))
+    f.write(",".join(str(p) for p in positions) + "\n")
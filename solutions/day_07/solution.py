@@ -1,15 +1,19 @@
-from typing import Callable, TextIO
+from array import array
+from typing import Callable, Sequence, TextIO
+
+from solutions.common import load_input, read_ints
 
 FILE = "solutions/day_07/input.txt"
 TEST_FILE = "solutions/day_07/test_input.txt"
 
+FuelFn = Callable[[Sequence[int], int], int]
+
 
-def get_crab_positions_from_file(f: TextIO) -> tuple[int, ...]:
-    raw_crabs = f.readline().rstrip()
-    return tuple(int(c) for c in raw_crabs.split(","))
+def get_crab_positions_from_file(f: TextIO) -> array:
+    return read_ints(f)
 
 
-def get_fuel_for_crabs(crabs: tuple[int, ...], position: int) -> int:
+def get_fuel_for_crabs(crabs: Sequence[int], position: int) -> int:
     return sum(abs(c - position) for c in crabs)
 
 
@@ -17,32 +21,80 @@ def get_non_linear_fuel(distance: int) -> int:
     return (distance * (distance + 1)) // 2
 
 
-def get_refined_fuel(crabs: tuple[int, ...], position: int) -> int:
+def get_refined_fuel(crabs: Sequence[int], position: int) -> int:
     """Calculates the non-linear fuel expended for part b"""
     return sum(get_non_linear_fuel(abs(c - position)) for c in crabs)
 
 
-def solve(fuel_fn: Callable):
-    with open(FILE) as f:
-        crabs = get_crab_positions_from_file(f)
-
-    min_position = min(crabs)
-    max_position = max(crabs)
-
-    lowest_fuel = float("inf")
-    for position in range(min_position, max_position + 1):
-        fuel = fuel_fn(crabs, position)
-        lowest_fuel = min(lowest_fuel, fuel)
-
-    return int(lowest_fuel)
+def ternary_search(crabs: Sequence[int], fuel_fn: FuelFn) -> int:
+    """
+    The lowest fuel for any fuel_fn convex in the position, in O(log range) calls.
+    Where the two probes tie, the lowest is between them, so either side can go.
+    """
+    low, high = min(crabs), max(crabs)
+    while high - low > 2:
+        third = (high - low) // 3
+        if fuel_fn(crabs, low + third) <= fuel_fn(crabs, high - third):
+            high = high - third
+        else:
+            low = low + third + 1
+    return min(fuel_fn(crabs, position) for position in range(low, high + 1))
+
+
+def align_linear(crabs: Sequence[int]) -> int:
+    """Moving any way from the median moves away from at least half the crabs"""
+    median = sorted(crabs)[len(crabs) // 2]
+    return get_fuel_for_crabs(crabs, median)
+
+
+def align_triangular(crabs: Sequence[int]) -> int:
+    """The lowest triangular fuel is always within half a position of the mean"""
+    mean = sum(crabs) // len(crabs)
+    return min(get_refined_fuel(crabs, p) for p in (mean, mean + 1))
+
+
+def all_fuel_costs(crabs: Sequence[int], triangular: bool = False) -> list[int]:
+    """
+    The fuel to align at every position from the first crab to the last, in
+    O(n + range) by counting crabs at each position and keeping running totals of
+    the crabs, and their positions, at or before the one being moved past.
+    """
+    start = min(crabs)
+    counts = [0] * (max(crabs) - start + 1)
+    for c in crabs:
+        counts[c - start] += 1
+
+    fuel_fn = get_refined_fuel if triangular else get_fuel_for_crabs
+    fuel = fuel_fn(crabs, start)
+    costs = [fuel]
+    left_count = left_sum = 0
+    right_count, right_sum = len(crabs), sum(crabs)
+    for position, count in enumerate(counts[:-1], start):
+        left_count += count
+        left_sum += count * position
+        right_count -= count
+        right_sum -= count * position
+        if triangular:
+            # Each crab at or before position moves one step further than it has
+            # so far, and each after one step less
+            fuel += left_count * (position + 1) - left_sum
+            fuel -= right_sum - right_count * position
+        else:
+            fuel += left_count - right_count
+        costs.append(fuel)
+    return costs
+
+
+def solve(fuel_fn: FuelFn) -> int:
+    return ternary_search(load_input(FILE, get_crab_positions_from_file), fuel_fn)
 
 
 def solve_part_a() -> int:
-    return solve(get_fuel_for_crabs)
+    return align_linear(load_input(FILE, get_crab_positions_from_file))
 
 
 def solve_part_b() -> int:
-    return solve(get_refined_fuel)
+    return align_triangular(load_input(FILE, get_crab_positions_from_file))
 
 
 def run():
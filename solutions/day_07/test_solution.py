@@ -0,0 +1,38 @@
+import pytest
+
+from solutions.day_07.solution import (
+    TEST_FILE,
+    align_linear,
+    align_triangular,
+    all_fuel_costs,
+    get_crab_positions_from_file,
+    get_fuel_for_crabs,
+    get_refined_fuel,
+    ternary_search,
+)
+
+
+@pytest.fixture
+def crabs():
+    with open(TEST_FILE) as f:
+        return get_crab_positions_from_file(f)
+
+
+def test_align(crabs):
+    assert align_linear(crabs) == 37
+    assert align_triangular(crabs) == 168
+
+
+@pytest.mark.parametrize(
+    "fuel_fn,lowest", [(get_fuel_for_crabs, 37), (get_refined_fuel, 168)]
+)
+def test_ternary_search(crabs, fuel_fn, lowest):
+    assert ternary_search(crabs, fuel_fn) == lowest
+
+
+@pytest.mark.parametrize(
+    "fuel_fn,triangular", [(get_fuel_for_crabs, False), (get_refined_fuel, True)]
+)
+def test_all_fuel_costs(crabs, fuel_fn, triangular):
+    expected = [fuel_fn(crabs, p) for p in range(min(crabs), max(crabs) + 1)]
+    assert all_fuel_costs(crabs, triangular) == expected
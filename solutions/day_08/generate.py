@@ -0,0 +1,31 @@
+import random
+from typing import TextIO
+
+SEGMENTS = "abcdefg"
+DIGITS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+
+def _scramble(digit: str, wiring: dict[str, str], rng: random.Random) -> str:
+    wires = [wiring[s] for s in digit]
+    rng.shuffle(wires)
+    return "".join(wires)
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """size displays, each with its own random wiring"""
+    for _ in range(size):
+        wiring = dict(zip(SEGMENTS, rng.sample(SEGMENTS, len(SEGMENTS))))
+        tests = [_scramble(d, wiring, rng) for d in rng.sample(DIGITS, len(DIGITS))]
+        outputs = [_scramble(rng.choice(DIGITS), wiring, rng) for _ in range(4)]
+        f.write(f"{' '.join(tests)} | {' '.join(outputs)}\n")
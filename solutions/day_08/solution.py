@@ -1,6 +1,10 @@
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Iterator, TextIO
+import itertools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, Optional, TextIO
+
+from solutions.common import load_input
 
 FILE = "solutions/day_08/input.txt"
 TEST_FILE = "solutions/day_08/test_input.txt"
@@ -31,85 +35,72 @@ NUMBERS_TO_SEGMENTS = {
 SEGMENTS_TO_NUMBERS = {s: n for n, s in NUMBERS_TO_SEGMENTS.items()}
 
 
+# How many digits each segment is lit in. A digit's signature, the total of this
+# over its segments, is the same however the wires are mixed up, and differs for
+# every digit, so it identifies a pattern without trying the 5040 wirings.
+SEGMENT_COUNTS = Counter(itertools.chain.from_iterable(NUMBERS_TO_SEGMENTS.values()))
+
+SIGNATURES_TO_NUMBERS = {
+    sum(SEGMENT_COUNTS[s] for s in segments): n
+    for n, segments in NUMBERS_TO_SEGMENTS.items()
+}
+
+
+def canonical(pattern: str) -> str:
+    return "".join(sorted(pattern))
+
+
+# Every display's patterns in canonical order are one of the 5040 wirings, so the
+# cache can never grow past that
+@lru_cache(maxsize=None)
+def decode_wiring(patterns: tuple[str, ...]) -> dict[str, int]:
+    """The number each of the ten canonical patterns of a display shows"""
+    wires = "".join(patterns)
+    counts = {wire: wires.count(wire) for wire in set(wires)}
+    return {
+        pattern: SIGNATURES_TO_NUMBERS[sum(counts[wire] for wire in pattern)]
+        for pattern in patterns
+    }
+
+
 class Display:
     def __init__(self, test_digits: tuple[str, ...], output_digits: tuple[str, ...]):
         self.test_digits = test_digits
         self.output_digits = output_digits
 
-        segments_to_solve = "abcdefg"
-        actual_segments = "hijklmn"
-        numbers = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
-        self.possible_segments = {s: set(actual_segments) for s in segments_to_solve}
-        self.possible_numbers = {}
-        for d in self.test_digits:
-            self.possible_numbers[d] = set(
-                n for n in numbers if len(d) == len(NUMBERS_TO_SEGMENTS[n])
-            )
-        self.solve()
-
-    def _update_possible_segments(self):
-        for digit, numbers in self.possible_numbers.items():
-            for segment in digit:
-                possible_segments = set.union(
-                    *[set(NUMBERS_TO_SEGMENTS[n]) for n in numbers]
-                )
-                self.possible_segments[segment] &= possible_segments
-
-        options = list(self.possible_segments.values())
-        for option in options:
-            if len(option) == options.count(option):
-                for segment, possibilities in self.possible_segments.items():
-                    if possibilities != option:
-                        possibilities -= option
-
-    def _update_possible_numbers(self):
-        for digit, numbers in self.possible_numbers.items():
-            impossible = set()
-            for number in numbers:
-                possible_segments = set.union(
-                    *[self.possible_segments[s] for s in digit]
-                )
-                if not possible_segments.issuperset(NUMBERS_TO_SEGMENTS[number]):
-                    impossible.add(number)
-
-                # for segment, options in self.possible_segments.values:
-                #     if all(option in digit for option in options) and not
-                options = list(self.possible_segments.values())
-                known = defaultdict(set)
-                for segment, possibilities in self.possible_segments.items():
-                    if len(possibilities) == options.count(possibilities):
-                        known[frozenset(possibilities)].add(segment)
-
-                for known_poss, known_segments in known.items():
-                    if all(
-                        s in digit for s in known_segments
-                    ) and not NUMBERS_TO_SEGMENTS[number].issuperset(known_poss):
-                        impossible.add(number)
-
-            numbers -= impossible
-
     def solve(self) -> int:
-        self._update_possible_segments()
-        self._update_possible_segments()
-        self._update_possible_numbers()
-
-        real_outputs = []
-        frozen_possibles = {frozenset(d): ns for d, ns in self.possible_numbers.items()}
+        wiring = decode_wiring(tuple(sorted(map(canonical, self.test_digits))))
+        output = 0
         for digit in self.output_digits:
-            (real_digit,) = frozen_possibles[frozenset(digit)]
-            real_outputs.append(real_digit)
-        return int("".join([str(o) for o in real_outputs]))
+            output = output * 10 + wiring[canonical(digit)]
+        return output
+
+
+def parse_display(line: str) -> Display:
+    tests, outputs = line.rstrip().split("|")
+    return Display(
+        test_digits=tuple(tests.split()),
+        output_digits=tuple(outputs.split()),
+    )
 
 
 def yield_displays(file: TextIO) -> Iterator[Display]:
     for line in file:
-        tests, outputs = line.rstrip().split("|")
-        yield (
-            Display(
-                test_digits=tuple(tests.split()),
-                output_digits=tuple(outputs.split()),
-            )
-        )
+        yield parse_display(line)
+
+
+def parse_displays(file: TextIO) -> list[Display]:
+    return list(yield_displays(file))
+
+
+def decode_line(line: str) -> int:
+    return parse_display(line).solve()
+
+
+def decode_file(path: str, workers: Optional[int] = None) -> list[int]:
+    """The output of every display in a file, decoded across worker processes"""
+    with open(path) as f, ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(decode_line, f, chunksize=1024))
 
 
 def is_number_1_4_7_or_8(segments: str) -> bool:
@@ -118,19 +109,17 @@ def is_number_1_4_7_or_8(segments: str) -> bool:
 
 def solve_part_a() -> int:
     ones_fours_sevens_and_eights = 0
-    with open(FILE) as f:
-        for display in yield_displays(f):
-            for digit in display.output_digits:
-                if is_number_1_4_7_or_8(digit):
-                    ones_fours_sevens_and_eights += 1
+    for display in load_input(FILE, parse_displays):
+        for digit in display.output_digits:
+            if is_number_1_4_7_or_8(digit):
+                ones_fours_sevens_and_eights += 1
     return ones_fours_sevens_and_eights
 
 
 def solve_part_b() -> int:
     total = 0
-    with open(FILE) as f:
-        for display in yield_displays(f):
-            total += display.solve()
+    for display in load_input(FILE, parse_displays):
+        total += display.solve()
     return total
 
 
@@ -0,0 +1,22 @@
+import itertools
+
+from solutions.day_08.solution import (
+    NUMBERS_TO_SEGMENTS,
+    TEST_FILE,
+    decode_file,
+    decode_wiring,
+)
+
+
+def test_decode_wiring_for_every_wiring():
+    for wires in itertools.permutations("abcdefg"):
+        rewire = dict(zip("hijklmn", wires))
+        patterns = {
+            "".join(sorted(rewire[s] for s in segments)): n
+            for n, segments in NUMBERS_TO_SEGMENTS.items()
+        }
+        assert decode_wiring(tuple(sorted(patterns))) == patterns
+
+
+def test_decode_file():
+    assert sum(decode_file(TEST_FILE, workers=2)) == 61229
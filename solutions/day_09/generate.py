@@ -0,0 +1,8 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """A size by size height map, with ridges of 9s splitting it into basins"""
+    for _ in range(size):
+        f.write("".join(str(rng.choice("0123456789999")) for _ in range(size)) + "\n")
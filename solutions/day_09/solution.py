@@ -1,58 +1,96 @@
 import math
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from typing import NamedTuple
 
-from solutions.common import ULDR, IntGrid, Point, get_adjacent_values
+from solutions.common import DenseIntGrid, IntGrid, Point, load_input
 
 FILE = "solutions/day_09/input.txt"
 TEST_FILE = "solutions/day_09/test_input.txt"
 
 
-def get_basin_size(grid: IntGrid, point: Point) -> int:
-    current_height = grid.get(point)
-    if current_height is None:
-        raise ValueError("Point is not in grid")
-    elif current_height == 9:
-        raise ValueError("Point is at max height, not in a basin")
-
-    visited = {point}
-    size = 1
-    to_visit = [v for p in ULDR if (v := point + p) in grid]
-    while to_visit:
-        current = to_visit.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-        height = grid[current]
-        if height == 9:
-            continue
-        size += 1
-        to_visit.extend([n for p in ULDR if (n := current + p) in grid])
-    return size
+class Basin(NamedTuple):
+    size: int
+    low_points: list[Point]
+    risk: int
 
 
-def solve_part_a() -> int:
-    with open(FILE) as f:
-        grid = IntGrid.from_file(f)
-    risk = 0
-    for point, height in grid:
-        if all(height < adj_height for adj_height in get_adjacent_values(grid, point)):
-            risk += height + 1
-    return risk
+def _find(parent: list[int], i: int) -> int:
+    while parent[i] != i:
+        # Halve the path on the way up, so later finds are shorter
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
 
 
-def solve_part_b() -> int:
-    with open(FILE) as f:
-        grid = IntGrid.from_file(f)
+def label_basins(grid: IntGrid) -> list[Basin]:
+    """
+    Every basin, the points not of height 9 joined up, down, left and right, in one
+    scan of the grid. Each point is joined to the basins of those to its left and
+    above by union-find, and checked for being a low point at the same time. Sparse
+    grids are copied into a dense one first.
+    """
+    grid = DenseIntGrid.from_grid(grid)
+    width, height, values, present = grid.width, grid.height, grid.values, grid.present
+    in_grid = present if present is not None else b"\x01" * len(values)
+    in_basin = bytes(v != 9 and p for v, p in zip(values, in_grid))
+
+    parent = list(range(len(values)))
     low_points = []
-    for point, height in grid:
-        if all(height < adj_height for adj_height in get_adjacent_values(grid, point)):
-            low_points.append(point)
+    for j in range(height):
+        row = j * width
+        for i in range(row, row + width):
+            if not in_grid[i]:
+                continue
+            h = values[i]
+            if (
+                (i == row or not in_grid[i - 1] or h < values[i - 1])
+                and (i == row + width - 1 or not in_grid[i + 1] or h < values[i + 1])
+                and (j == 0 or not in_grid[i - width] or h < values[i - width])
+                and (j == height - 1 or not in_grid[i + width] or h < values[i + width])
+            ):
+                low_points.append(i)
+            if not in_basin[i]:
+                continue
+            if i > row and in_basin[i - 1]:
+                parent[i] = _find(parent, i - 1)
+            if j > 0 and in_basin[i - width]:
+                above, this = _find(parent, i - width), _find(parent, i)
+                if above != this:
+                    parent[max(above, this)] = min(above, this)
+
+    sizes = Counter(_find(parent, i) for i, b in enumerate(in_basin) if b)
+    lows: defaultdict[int, list[int]] = defaultdict(list)
+    for i in low_points:
+        lows[_find(parent, i)].append(i)
+    return [
+        Basin(
+            size=size,
+            low_points=[grid.unpack(i) for i in lows[root]],
+            risk=sum(values[i] + 1 for i in lows[root]),
+        )
+        for root, size in sizes.items()
+    ]
+
+
+def total_risk(basins: list[Basin]) -> int:
+    return sum(basin.risk for basin in basins)
+
 
-    basin_sizes = [get_basin_size(grid, l) for l in low_points]
-    highest_3 = sorted(basin_sizes)[-3:]
+def largest_basins_product(basins: list[Basin]) -> int:
+    highest_3 = sorted(basin.size for basin in basins)[-3:]
     return math.prod(highest_3)
 
 
+def solve_part_a() -> int:
+    return total_risk(label_basins(load_input(FILE, IntGrid.from_file)))
+
+
+def solve_part_b() -> int:
+    return largest_basins_product(label_basins(load_input(FILE, IntGrid.from_file)))
+
+
 def run():
-    print(solve_part_a())
-    print(solve_part_b())
+    # Both parts come from the same labelling, so it only needs doing once
+    basins = label_basins(load_input(FILE, IntGrid.from_file))
+    print(total_risk(basins))
+    print(largest_basins_product(basins))
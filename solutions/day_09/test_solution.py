@@ -0,0 +1,13 @@
+import pytest
+
+from solutions.common import IntGrid, Point
+from solutions.day_09.solution import TEST_FILE, label_basins
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_label_basins(sparse: bool):
+    with open(TEST_FILE) as f:
+        basins = label_basins(IntGrid.from_file(f, sparse=sparse))
+    assert sorted(basin.size for basin in basins) == [3, 9, 9, 14]
+    assert sum(basin.risk for basin in basins) == 15
+    assert [Point(2, 2)] in [basin.low_points for basin in basins]
@@ -0,0 +1,35 @@
+import random
+from typing import TextIO
+
+OPEN_TO_CLOSE = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def _line(rng: random.Random, corrupt: bool) -> str:
+    chunks = []
+    open_brackets = []
+    for _ in range(rng.randint(20, 110)):
+        if open_brackets and rng.random() < 0.45:
+            chunks.append(OPEN_TO_CLOSE[open_brackets.pop()])
+        else:
+            bracket = rng.choice("([{<")
+            open_brackets.append(bracket)
+            chunks.append(bracket)
+    if not open_brackets:
+        open_brackets.append("(")
+        chunks.append("(")
+    if corrupt:
+        expected = OPEN_TO_CLOSE[open_brackets[-1]]
+        chunks.append(rng.choice([c for c in ")]}>" if c != expected]))
+    return "".join(chunks)
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """
+    size lines, roughly half corrupted and the rest incomplete, always with an
+    odd number of incomplete lines so the median score is one of them
+    """
+    corrupt = [rng.random() < 0.5 for _ in range(max(size, 1))]
+    if corrupt.count(False) % 2 == 0:
+        corrupt[0] = not corrupt[0]
+    for c in corrupt:
+        f.write(_line(rng, c) + "\n")
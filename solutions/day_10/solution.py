@@ -1,4 +1,10 @@
-import statistics
+import heapq
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+from solutions.common import chunk_boundaries, read_chunk_lines
 
 FILE = "solutions/day_10/input.txt"
 TEST_FILE = "solutions/day_10/test_input.txt"
@@ -24,59 +30,121 @@ OPEN_TO_COMPLETE_SCORE = {
 }
 
 
-def corruption_score(line: str) -> int:
+def score_line(line: str) -> tuple[int, int]:
+    """
+    The corruption and completion scores of a line in one scan, at most one of
+    which is not 0
+    """
     open_brackets = []
     for bracket in line:
         if bracket in OPEN_TO_CLOSE:
             open_brackets.append(bracket)
         elif matched := CLOSE_TO_OPEN.get(bracket):
-            if matched != open_brackets.pop():
-                return CLOSE_TO_CORRUPTION_SCORE[bracket]
+            if not open_brackets or matched != open_brackets.pop():
+                return CLOSE_TO_CORRUPTION_SCORE[bracket], 0
         else:
             raise ValueError(f"Found unexpected symbol {bracket}")
-    return 0
 
-
-def _calculate_incomplete_score(open_brackets: list[str]) -> int:
     score = 0
-    for bracket in open_brackets[::-1]:
-        score *= 5
-        score += OPEN_TO_COMPLETE_SCORE[bracket]
-    return score
+    for bracket in reversed(open_brackets):
+        score = score * 5 + OPEN_TO_COMPLETE_SCORE[bracket]
+    return 0, score
+
+
+def corruption_score(line: str) -> int:
+    return score_line(line)[0]
 
 
 def incomplete_score(line: str) -> int:
-    open_brackets = []
-    for bracket in line:
-        if bracket in OPEN_TO_CLOSE:
-            open_brackets.append(bracket)
-        elif matched := CLOSE_TO_OPEN.get(bracket):
-            if matched != open_brackets.pop():
-                return 0
+    return score_line(line)[1]
+
+
+class RunningMedian:
+    """Median of the values added so far, keeping the lower and upper halves in heaps"""
+
+    def __init__(self):
+        # Negated, so the largest of the lower half is on top
+        self._lower: list[int] = []
+        self._upper: list[int] = []
+
+    def add(self, value: int):
+        if self._lower and value > -self._lower[0]:
+            heapq.heappush(self._upper, value)
         else:
-            raise ValueError(f"Found unexpected symbol {bracket}")
+            heapq.heappush(self._lower, -value)
+        # Keep the lower half the same size as the upper, or one larger
+        if len(self._lower) > len(self._upper) + 1:
+            heapq.heappush(self._upper, -heapq.heappop(self._lower))
+        elif len(self._upper) > len(self._lower):
+            heapq.heappush(self._lower, -heapq.heappop(self._upper))
+
+    def __len__(self) -> int:
+        return len(self._lower) + len(self._upper)
+
+    @property
+    def median(self) -> float:
+        if not self._lower:
+            raise ValueError("No values to take the median of")
+        if len(self._lower) > len(self._upper):
+            return -self._lower[0]
+        return (self._upper[0] - self._lower[0]) / 2
+
 
-    return _calculate_incomplete_score(open_brackets)
+def score_lines(lines: Iterable[str]) -> tuple[int, list[int]]:
+    """The total corruption score of the lines, and every completion score"""
+    corruption = 0
+    completions = []
+    for line in lines:
+        line_corruption, completion = score_line(line.rstrip())
+        corruption += line_corruption
+        if completion:
+            completions.append(completion)
+    return corruption, completions
+
+
+def score_chunk(path: str, start: int, end: int) -> tuple[int, list[int]]:
+    with open(path, "rb") as f:
+        lines = read_chunk_lines(f, start, end)
+        return score_lines(line.decode() for line in lines)
+
+
+def score_file(path: str, workers: Optional[int] = 1) -> tuple[int, RunningMedian]:
+    """
+    The total corruption score of a file, and the running median of its completion
+    scores. With more than one worker, the file is scored in chunks in parallel.
+    """
+    if workers == 1:
+        with open(path) as f:
+            chunks = [score_lines(f)]
+    else:
+        workers = workers or os.cpu_count() or 1
+        boundaries = chunk_boundaries(path, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(
+                executor.map(
+                    score_chunk, itertools.repeat(path), boundaries, boundaries[1:]
+                )
+            )
+
+    corruption = 0
+    median = RunningMedian()
+    for chunk_corruption, completions in chunks:
+        corruption += chunk_corruption
+        for completion in completions:
+            median.add(completion)
+    return corruption, median
 
 
 def solve_part_a() -> int:
-    score = 0
-    with open(FILE) as f:
-        for line in f:
-            score += corruption_score(line.rstrip())
-    return score
+    corruption, _ = score_file(FILE)
+    return corruption
 
 
 def solve_part_b() -> int:
-    scores = []
-    with open(FILE) as f:
-        for line in f:
-            score = incomplete_score(line.rstrip())
-            if score != 0:
-                scores.append(score)
-    median = statistics.median(scores)
+    _, completions = score_file(FILE)
+    median = completions.median
     if not isinstance(median, int):
-        raise ValueError("Odd number of scores, error in input or code")
+        raise ValueError("Even number of scores, error in input or code")
     return median
 
 
@@ -0,0 +1,28 @@
+import random
+import statistics
+
+import pytest
+
+from solutions.day_10.solution import TEST_FILE, RunningMedian, score_file, score_line
+
+
+def test_score_line():
+    assert score_line("{([(<{}[<>[]}>{[]{[(<()>") == (1197, 0)
+    assert score_line("<{([{{}}[<[[[<>{}]]]>[]]") == (0, 294)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_score_file(workers):
+    corruption, completions = score_file(TEST_FILE, workers)
+    assert corruption == 26397
+    assert completions.median == 288957
+
+
+def test_running_median():
+    rng = random.Random(0)
+    values = []
+    median = RunningMedian()
+    for _ in range(101):
+        values.append(rng.randint(0, 50))
+        median.add(values[-1])
+        assert median.median == statistics.median(values)
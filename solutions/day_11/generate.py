@@ -0,0 +1,11 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """
+    A size by size grid of energy levels. Random grids are not guaranteed to ever
+    all flash at once.
+    """
+    for _ in range(size):
+        f.write("".join(str(rng.randint(0, 9)) for _ in range(size)) + "\n")
@@ -1,83 +1,271 @@
-from typing import TextIO
+from __future__ import annotations
 
-from solutions.common import IntGrid, Point
+import copy
+import hashlib
+from typing import NamedTuple, Optional
+
+from solutions.common import DenseIntGrid, IntGrid, load_input
 
 FILE = "solutions/day_11/input.txt"
 TEST_FILE = "solutions/day_11/test_input.txt"
 
-DIRECTIONS = (
-    Point(0, 1),
-    Point(1, 1),
-    Point(1, 0),
-    Point(1, -1),
-    Point(0, -1),
-    Point(-1, -1),
-    Point(-1, 0),
-    Point(-1, 1),
-)
 FLASH = 10
 
+# Adds one to every energy level in a bytearray
+_INCREASE = bytes(range(1, 256)) + b"\x00"
 
-def increase_energy_levels(grid: IntGrid):
-    for point, energy in grid:
-        grid[point] = energy + 1
 
+class Cavern:
+    """
+    Energy levels of a rectangle of octopuses in a flat bytearray, stepped by
+    following each flash to its neighbours with a worklist
+    """
 
-def process_flash(grid: IntGrid, point: Point):
-    for p in (d + point for d in DIRECTIONS):
-        energy = grid.get(p)
-        if energy is None or energy == FLASH or energy == 0:
-            continue
-        grid[p] = energy + 1
-    grid[point] = 0
+    def __init__(self, grid: IntGrid):
+        grid = DenseIntGrid.from_grid(grid)
+        if grid.present is not None:
+            raise ValueError("Octopuses must fill the grid")
+        self.width = grid.width
+        self.height = grid.height
+        self.energy = bytearray(grid.values)
+        adjacency = grid.adjacency(diagonal=True)
+        self.neighbours = [tuple(adjacency[i]) for i in range(len(adjacency))]
 
+    def __len__(self) -> int:
+        return len(self.energy)
 
-def process_flashes(grid: IntGrid) -> int:
-    to_flash = []
-    for point, energy in grid:
-        if energy == FLASH:
-            to_flash.append(point)
-    if not to_flash:
-        return 0
-    for p in to_flash:
-        process_flash(grid, p)
-    return len(to_flash)
+    def step(self) -> int:
+        energy = self.energy
+        energy[:] = energy.translate(_INCREASE)
+        to_flash = []
+        i = energy.find(FLASH)
+        while i != -1:
+            to_flash.append(i)
+            i = energy.find(FLASH, i + 1)
 
+        flashes = 0
+        neighbours = self.neighbours
+        while to_flash:
+            i = to_flash.pop()
+            energy[i] = 0
+            flashes += 1
+            for n in neighbours[i]:
+                e = energy[n]
+                # 0 has already flashed this step, and FLASH is waiting to
+                if e and e < FLASH:
+                    energy[n] = e + 1
+                    if e + 1 == FLASH:
+                        to_flash.append(n)
+        return flashes
 
-def step(grid: IntGrid) -> int:
-    flashes = 0
-    increase_energy_levels(grid)
-    while flashed := process_flashes(grid):
-        flashes += flashed
-    return flashes
+    def energies(self) -> bytes:
+        """Energy levels row by row"""
+        return bytes(self.energy)
 
+    def digest(self) -> bytes:
+        """Compact hash of the energy levels, for spotting repeated states"""
+        return hashlib.blake2b(self.energy, digest_size=16).digest()
 
-def all_flash(grid: IntGrid) -> bool:
-    flashes = step(grid)
-    if flashes == len(grid):
-        return True
-    return False
+    def copy(self) -> Cavern:
+        cavern = copy.copy(self)
+        cavern.energy = self.energy.copy()
+        return cavern
 
 
-def solve_part_a() -> int:
-    with open(FILE) as f:
-        grid = IntGrid.from_file(f)
+# Bits of energy level in a BitboardCavern. Levels reach at most 9, plus 1 for the
+# step, plus 8 from neighbours flashing, so 5 bits never overflow.
+PLANES = 5
 
-    flashes = 0
-    for _ in range(100):
-        flashes += step(grid)
 
-    return flashes
+class BitboardCavern:
+    """
+    Energy levels of a rectangle of octopuses as bit planes, each an int with a
+    bit per octopus holding that bit of its level. A round of flashes adds the
+    flash mask shifted towards each of the eight neighbours to every octopus at
+    once, like a 3x3 convolution, so each round costs a few dozen int operations
+    however large the grid is. Rows are a bit wider than the grid, with the spare
+    bit always 0, so shifting left or right never wraps onto the next row.
+    """
 
+    def __init__(self, grid: IntGrid):
+        grid = DenseIntGrid.from_grid(grid)
+        if grid.present is not None:
+            raise ValueError("Octopuses must fill the grid")
+        self.width = grid.width
+        self.height = grid.height
+        stride = self._stride = grid.width + 1
 
-def solve_part_b() -> int:
-    with open(FILE) as f:
-        grid = IntGrid.from_file(f)
+        self.planes = [0] * PLANES
+        for index, e in enumerate(grid.values):
+            z, x = divmod(index, grid.width)
+            for plane in range(PLANES):
+                if e >> plane & 1:
+                    self.planes[plane] |= 1 << (z * stride + x)
+
+        row = (1 << grid.width) - 1
+        self._cells = sum(row << (z * stride) for z in range(grid.height))
+        self._shifts = (1, stride - 1, stride, stride + 1)
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def _add(self, mask: int):
+        """Adds one to the energy level of each octopus in the mask"""
+        planes = self.planes
+        for plane in range(PLANES):
+            if not mask:
+                break
+            planes[plane], mask = planes[plane] ^ mask, planes[plane] & mask
+
+    def step(self) -> int:
+        cells = self._cells
+        self._add(cells)
+        flashed = 0
+        while True:
+            p = self.planes
+            # At least 10 is 16 and above, or 8 with 2 or 4
+            charged = p[4] | p[3] & (p[2] | p[1])
+            new = charged & ~flashed
+            if not new:
+                break
+            flashed |= new
+            for shift in self._shifts:
+                self._add(new << shift & cells)
+                self._add(new >> shift & cells)
+        self.planes = [p & ~flashed for p in self.planes]
+        return flashed.bit_count()
+
+    def energies(self) -> bytes:
+        """Energy levels row by row"""
+        levels = bytearray(len(self))
+        for plane, bits in enumerate(self.planes):
+            for z in range(self.height):
+                row = bits >> (z * self._stride)
+                for x in range(self.width):
+                    if row >> x & 1:
+                        levels[z * self.width + x] |= 1 << plane
+        return bytes(levels)
+
+    def digest(self) -> bytes:
+        """Compact hash of the energy levels, for spotting repeated states"""
+        length = (self._stride * self.height + 7) // 8
+        h = hashlib.blake2b(digest_size=16)
+        for bits in self.planes:
+            h.update(bits.to_bytes(length, "little"))
+        return h.digest()
+
+    def copy(self) -> BitboardCavern:
+        cavern = copy.copy(self)
+        cavern.planes = self.planes.copy()
+        return cavern
+
+
+def make_cavern(grid: IntGrid, vectorized: bool = False) -> Cavern | BitboardCavern:
+    """
+    Bitboards pay off for grids of thousands of octopuses and more. Sparse grids
+    are copied into a dense one, which must have no gaps.
+    """
+    return BitboardCavern(grid) if vectorized else Cavern(grid)
+
+
+class Cycle(NamedTuple):
+    """
+    Octopuses repeat the steps from start + 1 to start + period forever after, and
+    flashes holds how many flash on every step up to then
+    """
 
-    step = 1
-    while not all_flash(grid):
+    start: int
+    period: int
+    flashes: list[int]
+
+    def total_flashes(self, steps: int) -> int:
+        """Flashes over the first steps, without stepping past the first cycle"""
+        if steps <= len(self.flashes):
+            return sum(self.flashes[:steps])
+        cycle = self.flashes[self.start :]
+        cycles, remainder = divmod(steps - self.start, self.period)
+        return (
+            sum(self.flashes[: self.start])
+            + cycles * sum(cycle)
+            + sum(cycle[:remainder])
+        )
+
+    def first_synchronized(self, octopuses: int) -> Optional[int]:
+        """The first step every octopus flashes on, or None if they never do"""
+        for step, flashes in enumerate(self.flashes, 1):
+            if flashes == octopuses:
+                return step
+        return None
+
+
+def find_cycle(cavern: Cavern | BitboardCavern) -> Cycle:
+    """
+    Finds where the states of the octopuses repeat with Brent's algorithm, which
+    compares the digest of each state with that of one saved at each power of two
+    steps. Only the one saved digest is kept, however long the cycle.
+    """
+    saved = cavern.digest()
+    hare = cavern.copy()
+    hare.step()
+    power = period = 1
+    while hare.digest() != saved:
+        if power == period:
+            saved = hare.digest()
+            power *= 2
+            period = 0
+        hare.step()
+        period += 1
+
+    # With the hare a period ahead, they first meet where the cycle starts
+    tortoise, hare = cavern.copy(), cavern.copy()
+    for _ in range(period):
+        hare.step()
+    start = 0
+    while tortoise.digest() != hare.digest():
+        tortoise.step()
+        hare.step()
+        start += 1
+
+    cavern = cavern.copy()
+    flashes = [cavern.step() for _ in range(start + period)]
+    return Cycle(start, period, flashes)
+
+
+def first_synchronized_step(cavern: Cavern | BitboardCavern) -> Optional[int]:
+    """
+    The first step every octopus flashes on, or None if they never do. Steps the
+    octopuses directly, watching for a repeated state as in find_cycle, which
+    means every state has been seen and they never will.
+    """
+    cavern = cavern.copy()
+    octopuses = len(cavern)
+    saved = cavern.digest()
+    power = period = 1
+    step = 0
+    while True:
         step += 1
+        if cavern.step() == octopuses:
+            return step
+        digest = cavern.digest()
+        if digest == saved:
+            return None
+        if power == period:
+            saved = digest
+            power *= 2
+            period = 0
+        period += 1
+
+
+def solve_part_a() -> int:
+    cavern = make_cavern(load_input(FILE, IntGrid.from_file))
+    return sum(cavern.step() for _ in range(100))
+
 
+def solve_part_b() -> int:
+    cavern = make_cavern(load_input(FILE, IntGrid.from_file))
+    step = first_synchronized_step(cavern)
+    if step is None:
+        raise ValueError("Octopuses never all flash at once")
     return step
 
 
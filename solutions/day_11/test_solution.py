@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from solutions.common import IntGrid
+from solutions.day_11.solution import (
+    TEST_FILE,
+    find_cycle,
+    first_synchronized_step,
+    make_cavern,
+)
+
+
+@pytest.fixture
+def grid():
+    with open(TEST_FILE) as f:
+        return IntGrid.from_file(f)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_step(grid, vectorized):
+    cavern = make_cavern(grid, vectorized)
+    assert sum(cavern.step() for _ in range(100)) == 1656
+    # All the octopuses first flash together on step 195
+    assert [cavern.step() == len(cavern) for _ in range(95)].index(True) == 94
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_sparse_grid(grid, vectorized):
+    with open(TEST_FILE) as f:
+        sparse = IntGrid.from_file(f, sparse=True)
+    cavern = make_cavern(sparse, vectorized)
+    assert cavern.energies() == make_cavern(grid, vectorized).energies()
+    assert sum(cavern.step() for _ in range(100)) == 1656
+
+
+def test_modes_agree(grid):
+    cavern, bitboard = make_cavern(grid), make_cavern(grid, vectorized=True)
+    for _ in range(50):
+        assert cavern.step() == bitboard.step()
+        assert cavern.energies() == bitboard.energies()
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_find_cycle(grid, vectorized):
+    cycle = find_cycle(make_cavern(grid, vectorized))
+    assert cycle.first_synchronized(len(grid)) == 195
+    assert cycle.total_flashes(100) == 1656
+
+    cavern = make_cavern(grid, vectorized)
+    flashes = [cavern.step() for _ in range(1000)]
+    assert cycle.total_flashes(1000) == sum(flashes)
+    end = cycle.start + cycle.period
+    assert flashes[cycle.start : end] == flashes[end : end + cycle.period]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_first_synchronized_step(grid, vectorized):
+    assert first_synchronized_step(make_cavern(grid, vectorized)) == 195
+    never = IntGrid.from_file(io.StringIO("41\n"))
+    assert first_synchronized_step(make_cavern(never, vectorized)) is None
@@ -0,0 +1,33 @@
+import itertools
+import random
+import string
+from typing import Iterator, TextIO
+
+
+def _names(letters: str) -> Iterator[str]:
+    for length in itertools.count(2):
+        for name in itertools.product(letters, repeat=length):
+            yield "".join(name)
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """
+    About size edges between small and big caves. Big caves are never joined to
+    each other, as then there would be infinitely many paths.
+    """
+    # Enough small caves that about twice size distinct edges are possible
+    caves = int((4 * size) ** 0.5) + 4
+    small = list(itertools.islice(_names(string.ascii_lowercase), caves))
+    big = list(itertools.islice(_names(string.ascii_uppercase), max(1, caves // 4)))
+
+    edges = set()
+    for cave in ("start", "end"):
+        for other in rng.sample(small, 2) + [rng.choice(big)]:
+            edges.add((cave, other))
+    while len(edges) < size:
+        l = rng.choice(small)
+        r = rng.choice(small + big)
+        if l != r and (r, l) not in edges:
+            edges.add((l, r))
+    for l, r in edges:
+        f.write(f"{l}-{r}\n")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import functools
+import itertools
 from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable, TextIO
+from typing import Callable, Iterator, Optional, TextIO
+
+from solutions.common import load_input
 
 FILE = "solutions/day_12/input.txt"
 TEST_FILE = "solutions/day_12/test_input.txt"
@@ -26,15 +30,20 @@ class Node:
 
     @property
     def node_type(self) -> NodeType:
-        if self.name == "start":
-            return NodeType.START
-        elif self.name == "end":
-            return NodeType.END
-        elif self.name.isupper():
-            return NodeType.BIG
-        elif self.name.islower():
-            return NodeType.SMALL
-        raise ValueError(f"Invalid node name {self.name}")
+        return name_type(self.name)
+
+
+@functools.lru_cache(maxsize=None)
+def name_type(name: str) -> NodeType:
+    if name == "start":
+        return NodeType.START
+    elif name == "end":
+        return NodeType.END
+    elif name.isupper():
+        return NodeType.BIG
+    elif name.islower():
+        return NodeType.SMALL
+    raise ValueError(f"Invalid node name {name}")
 
 
 Graph = dict[str, Node]
@@ -72,40 +81,113 @@ def can_visit_node_b(node: Node, visited: Counter[str]) -> bool:
         if all(
             count == 1
             for node, count in visited.items()
-            if Node(node).node_type is NodeType.SMALL
+            if name_type(node) is NodeType.SMALL
         ):
             return True
     return node.name not in visited
 
 
-def count_paths_through_graph(graph: Graph, visit_fn: Callable) -> int:
-    paths = [[graph["start"]]]
-    completed = []
-    while paths:
-        path = paths.pop()
-        visited = Counter([p.name for p in path])
-        for next_node in path[-1].children:
-            if not visit_fn(next_node, visited):
+def iterate_paths(
+    graph: Graph, visit_fn: Callable, limit: Optional[int] = None
+) -> Iterator[tuple[str, ...]]:
+    """
+    Yields each path from start to end as a tuple of cave names, at most limit of
+    them, going through each cave's neighbours in name order. Only the current path
+    is held, so paths are found as they are asked for.
+    """
+    return itertools.islice(_walk_paths(graph, visit_fn), limit)
+
+
+def _walk_paths(graph: Graph, visit_fn: Callable) -> Iterator[tuple[str, ...]]:
+    neighbours = {
+        name: sorted(node.children, key=lambda n: n.name)
+        for name, node in graph.items()
+    }
+    path = [graph["start"].name]
+    visited = Counter(path)
+    stack = [iter(neighbours[path[0]])]
+    while stack:
+        for node in stack[-1]:
+            if not visit_fn(node, visited):
                 continue
-            if next_node.node_type is NodeType.END:
-                completed.append(path + [next_node])
+            if node.node_type is NodeType.END:
+                yield (*path, node.name)
                 continue
-            paths.append(path + [next_node])
-    return len(completed)
+            path.append(node.name)
+            visited[node.name] += 1
+            stack.append(iter(neighbours[node.name]))
+            break
+        else:
+            stack.pop()
+            name = path.pop()
+            visited[name] -= 1
+            if not visited[name]:
+                del visited[name]
+
+
+def count_paths_through_graph(graph: Graph, visit_fn: Callable) -> int:
+    return sum(1 for _ in iterate_paths(graph, visit_fn))
+
+
+class CompiledGraph:
+    """
+    A graph with nodes numbered in order of name, each small cave given its own bit
+    so the small caves on a path fit in one int
+    """
+
+    def __init__(self, graph: Graph):
+        self.names = sorted(graph)
+        ids = {name: i for i, name in enumerate(self.names)}
+        self.start = ids["start"]
+        self.end = ids["end"]
+        self.neighbours = [
+            tuple(sorted(ids[child.name] for child in graph[name].children))
+            for name in self.names
+        ]
+        small = [name_type(name) is NodeType.SMALL for name in self.names]
+        self.small_bits = [
+            1 << i if is_small else 0 for i, is_small in enumerate(small)
+        ]
+
+
+def count_paths(graph: CompiledGraph, revisit_one: bool = False) -> int:
+    """
+    Counts paths from start to end, visiting small caves at most once, or one of
+    them twice with revisit_one. Paths reaching the same cave having visited the
+    same small caves go on in the same ways, so the count from each (cave, small
+    caves visited, revisit used) is found once and shared, making this exponential
+    only in the number of small caves.
+    """
+    neighbours, small_bits = graph.neighbours, graph.small_bits
+    start, end = graph.start, graph.end
+
+    @functools.cache
+    def count_from(node: int, visited: int, revisited: bool) -> int:
+        paths = 0
+        for n in neighbours[node]:
+            if n == end:
+                paths += 1
+            elif n == start:
+                continue
+            elif not small_bits[n] & visited:
+                paths += count_from(n, visited | small_bits[n], revisited)
+            elif revisit_one and not revisited:
+                paths += count_from(n, visited, True)
+        return paths
+
+    return count_from(start, 0, False)
 
 
 def solve_part_a() -> int:
-    with open(FILE) as f:
-        edges = load_edges_from_file(f)
-    graph = construct_graph_from_edges(edges)
-    return count_paths_through_graph(graph, can_visit_node_a)
+    edges = load_input(FILE, load_edges_from_file)
+    graph = CompiledGraph(construct_graph_from_edges(edges))
+    return count_paths(graph)
 
 
 def solve_part_b() -> int:
-    with open(FILE) as f:
-        edges = load_edges_from_file(f)
-    graph = construct_graph_from_edges(edges)
-    return count_paths_through_graph(graph, can_visit_node_b)
+    edges = load_input(FILE, load_edges_from_file)
+    graph = CompiledGraph(construct_graph_from_edges(edges))
+    return count_paths(graph, revisit_one=True)
 
 
 def run():
@@ -0,0 +1,47 @@
+import io
+import random
+
+import pytest
+
+from solutions.day_12.generate import generate
+from solutions.day_12.solution import (
+    TEST_FILE,
+    CompiledGraph,
+    can_visit_node_a,
+    can_visit_node_b,
+    construct_graph_from_edges,
+    count_paths,
+    count_paths_through_graph,
+    iterate_paths,
+    load_edges_from_file,
+)
+
+
+def test_count_paths():
+    with open(TEST_FILE) as f:
+        graph = CompiledGraph(construct_graph_from_edges(load_edges_from_file(f)))
+    assert count_paths(graph) == 19
+    assert count_paths(graph, revisit_one=True) == 103
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_count_paths_matches_enumerating(seed):
+    f = io.StringIO()
+    generate(f, 8, random.Random(seed))
+    f.seek(0)
+    graph = construct_graph_from_edges(load_edges_from_file(f))
+    compiled = CompiledGraph(graph)
+    assert count_paths(compiled) == count_paths_through_graph(graph, can_visit_node_a)
+    assert count_paths(compiled, revisit_one=True) == count_paths_through_graph(
+        graph, can_visit_node_b
+    )
+
+
+def test_iterate_paths():
+    with open(TEST_FILE) as f:
+        graph = construct_graph_from_edges(load_edges_from_file(f))
+    paths = list(iterate_paths(graph, can_visit_node_b))
+    assert len(set(paths)) == len(paths) == 103
+    assert all(p[0] == "start" and p[-1] == "end" for p in paths)
+    assert list(iterate_paths(graph, can_visit_node_b, limit=5)) == paths[:5]
+    assert list(iterate_paths(graph, can_visit_node_b, limit=0)) == []
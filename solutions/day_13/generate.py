@@ -0,0 +1,45 @@
+import random
+from typing import TextIO
+
+# Fewest folds along each axis, with more added for larger sizes
+FOLDS_PER_AXIS = 6
+FOLDED_WIDTH = 40
+FOLDED_HEIGHT = 6
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """
+    size dots, and folds which take the paper down to 40 by 6. Dots are placed on
+    the folded paper and then unfolded at random, so none lie on a fold. Each fold
+    along both axes quadruples the places a dot can be, and there are enough folds
+    that at least twice size places are possible.
+    """
+    folds_per_axis = FOLDS_PER_AXIS
+    while FOLDED_WIDTH * FOLDED_HEIGHT * 4**folds_per_axis < 2 * size:
+        folds_per_axis += 1
+
+    folds = []
+    width, height = FOLDED_WIDTH, FOLDED_HEIGHT
+    for _ in range(folds_per_axis):
+        folds.append(("x", width))
+        folds.append(("y", height))
+        width = 2 * width + 1
+        height = 2 * height + 1
+
+    dots = set()
+    while len(dots) < size:
+        x = rng.randrange(FOLDED_WIDTH)
+        y = rng.randrange(FOLDED_HEIGHT)
+        for axis, position in folds:
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * position - x
+                else:
+                    y = 2 * position - y
+        dots.add((x, y))
+
+    for x, y in dots:
+        f.write(f"{x},{y}\n")
+    f.write("\n")
+    for axis, position in reversed(folds):
+        f.write(f"fold along {axis}={position}\n")
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TextIO
+from typing import Iterable, TextIO
 
-from solutions.common import Point
+from solutions.common import Point, load_input
 
 FILE = "solutions/day_13/input.txt"
 TEST_FILE = "solutions/day_13/test_input.txt"
@@ -47,11 +47,41 @@ def fold_point(point: Point, fold: Fold) -> Point:
     raise ValueError(f"Unexpected axis {fold.axis}")
 
 
+def compose_folds(
+    coordinates: Iterable[int], positions: Iterable[int]
+) -> dict[int, int]:
+    """
+    Where each coordinate along one axis ends up after folding at each position in
+    turn. Each fold only maps the coordinates left after the one before, which
+    fold onto fewer and fewer, and the folds are then composed into one lookup.
+    """
+    current = set(coordinates)
+    steps = []
+    for p in positions:
+        step = {c: c if c < p else 2 * p - c for c in current}
+        steps.append(step)
+        current = set(step.values())
+
+    table = {c: c for c in current}
+    for step in reversed(steps):
+        table = {c: table[folded] for c, folded in step.items()}
+    return table
+
+
+def fold_all(grid: Grid, folds: Iterable[Fold]) -> Grid:
+    """Folds the grid along every fold, moving each point only once"""
+    folds = list(folds)
+    xs = compose_folds(
+        (p.x for p in grid), (f.position for f in folds if f.axis is Axis.X)
+    )
+    zs = compose_folds(
+        (p.z for p in grid), (f.position for f in folds if f.axis is Axis.Y)
+    )
+    return {Point(xs[x], zs[z]) for x, z in grid}
+
+
 def fold_grid(grid: Grid, fold: Fold) -> Grid:
-    new_grid = set()
-    for point in grid:
-        new_grid.add(fold_point(point, fold))
-    return new_grid
+    return fold_all(grid, [fold])
 
 
 def grid_to_str(grid: Grid) -> str:
@@ -72,18 +102,13 @@ def grid_to_str(grid: Grid) -> str:
 
 
 def solve_part_a() -> int:
-    with open(FILE) as f:
-        grid, folds = get_grid_and_folds_from_file(f)
-    grid = fold_grid(grid, folds[0])
-    return len(grid)
+    grid, folds = load_input(FILE, get_grid_and_folds_from_file)
+    return len(fold_all(grid, folds[:1]))
 
 
 def solve_part_b() -> int:
-    with open(FILE) as f:
-        grid, folds = get_grid_and_folds_from_file(f)
-    for fold in folds:
-        grid = fold_grid(grid, fold)
-    print(grid_to_str(grid))
+    grid, folds = load_input(FILE, get_grid_and_folds_from_file)
+    print(grid_to_str(fold_all(grid, folds)))
 
     # Answer is printed to screen
     return 0
@@ -0,0 +1,34 @@
+import io
+import random
+
+from solutions.day_13.generate import generate
+from solutions.day_13.solution import (
+    TEST_FILE,
+    compose_folds,
+    fold_all,
+    fold_point,
+    get_grid_and_folds_from_file,
+)
+
+
+def test_compose_folds():
+    # Folding at 7 then 3 takes 13 to 1, and 4 to 2
+    assert compose_folds([0, 4, 13], [7, 3]) == {0: 0, 4: 2, 13: 1}
+
+
+def test_fold_all():
+    with open(TEST_FILE) as f:
+        grid, folds = get_grid_and_folds_from_file(f)
+    assert len(fold_all(grid, folds[:1])) == 17
+    assert len(fold_all(grid, folds)) == 16
+
+
+def test_fold_all_matches_folding_each_point():
+    f = io.StringIO()
+    generate(f, 200, random.Random(4))
+    f.seek(0)
+    grid, folds = get_grid_and_folds_from_file(f)
+    expected = set(grid)
+    for fold in folds:
+        expected = {fold_point(p, fold) for p in expected}
+    assert fold_all(grid, folds) == expected
@@ -0,0 +1,13 @@
+import random
+import string
+from typing import TextIO
+
+ELEMENTS = string.ascii_uppercase[:10]
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """A polymer template of size elements, with an insertion rule for every pair"""
+    f.write("".join(rng.choice(ELEMENTS) for _ in range(max(size, 2))) + "\n\n")
+    for l in ELEMENTS:
+        for r in ELEMENTS:
+            f.write(f"{l}{r} -> {rng.choice(ELEMENTS)}\n")
@@ -1,6 +1,8 @@
 from collections import Counter
 from typing import TextIO
 
+from solutions.common import load_input
+
 FILE = "solutions/day_14/input.txt"
 TEST_FILE = "solutions/day_14/test_input.txt"
 
@@ -49,8 +51,9 @@ def convert_pairs_to_singles(polymers: Polymers, last_polymer: str) -> Counter[s
 
 
 def solve_for_n_steps(n: int) -> int:
-    with open(FILE) as f:
-        polymers, translations, last_polymer = load_polymers_and_translations(f)
+    polymers, translations, last_polymer = load_input(
+        FILE, load_polymers_and_translations
+    )
 
     for i in range(n):
         polymers = step_polymers(polymers, translations)
@@ -0,0 +1,8 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """A size by size grid of risk levels"""
+    for _ in range(size):
+        f.write("".join(str(rng.randint(1, 9)) for _ in range(size)) + "\n")
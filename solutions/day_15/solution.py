@@ -1,44 +1,40 @@
 import heapq
-from dataclasses import dataclass, field
-from typing import Any
 
-from solutions.common import IntGrid, Point, adjacent_points_and_values
+from solutions.common import DenseIntGrid, IntGrid, Point, load_input
 
 FILE = "solutions/day_15/input.txt"
 TEST_FILE = "solutions/day_15/test_input.txt"
 
 
-@dataclass(order=True)
-class PrioritizedItem:
-    priority: int
-    item: Any = field(compare=False)
-
-
 def shortest_path(grid: IntGrid) -> int:
     """
     Dijkstra's algorithm, using the notation from
     https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
+
+    Points are handled as their index into the values of the grid, copied into a
+    dense grid first if it is sparse.
     """
-    start, finish = grid.bounds
-    q = [PrioritizedItem(0, start)]
-    prev = {}
+    grid = DenseIntGrid.from_grid(grid)
+    start_point, finish_point = grid.bounds
+    start = grid.pack(start_point)
+    finish = grid.pack(finish_point)
+    adjacency = grid.adjacency()
+    risks = grid.values
+    q = [(0, start)]
     dist = {start: 0}
 
     while q:
-        u_item = heapq.heappop(q)
-        u = u_item.item
-        dist_u = u_item.priority
+        dist_u, u = heapq.heappop(q)
         if dist[u] != dist_u:
             continue
         if u == finish:
             return dist_u
 
-        for v, len_u_v in adjacent_points_and_values(grid, u):
-            alt = dist_u + len_u_v
+        for v in adjacency[u]:
+            alt = dist_u + risks[v]
             if v not in dist or alt < dist[v]:
                 dist[v] = alt
-                prev[v] = u
-                heapq.heappush(q, PrioritizedItem(alt, v))
+                heapq.heappush(q, (alt, v))
     raise RuntimeError("Never reached goal")
 
 
@@ -58,14 +54,12 @@ def expand_grid(grid: IntGrid) -> IntGrid:
 
 
 def solve_part_a() -> int:
-    with open(FILE) as f:
-        grid = IntGrid.from_file(f)
+    grid = load_input(FILE, IntGrid.from_file)
     return shortest_path(grid)
 
 
 def solve_part_b() -> int:
-    with open(FILE) as f:
-        grid = IntGrid.from_file(f)
+    grid = load_input(FILE, IntGrid.from_file)
     big_grid = expand_grid(grid)
     return shortest_path(big_grid)
 
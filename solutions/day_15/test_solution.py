@@ -0,0 +1,12 @@
+import pytest
+
+from solutions.common import IntGrid
+from solutions.day_15.solution import TEST_FILE, expand_grid, shortest_path
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_shortest_path(sparse: bool):
+    with open(TEST_FILE) as f:
+        grid = IntGrid.from_file(f, sparse=sparse)
+    assert shortest_path(grid) == 40
+    assert shortest_path(expand_grid(grid)) == 315
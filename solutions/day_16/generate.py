@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+from typing import TextIO
+
+# Packets are nested no deeper than this, to stay within the recursion limit
+MAX_DEPTH = 200
+
+
+def _literal(rng: random.Random) -> str:
+    value = rng.randrange(2 ** rng.randint(1, 32))
+    groups = f"{value:b}".zfill(-(-value.bit_length() // 4) * 4 or 4)
+    chunks = [groups[i : i + 4] for i in range(0, len(groups), 4)]
+    body = "".join(
+        ("0" if i == len(chunks) - 1 else "1") + chunk for i, chunk in enumerate(chunks)
+    )
+    return f"{rng.randrange(8):03b}100{body}"
+
+
+def _packet(rng: random.Random, budget: int, depth: int) -> tuple[str, int]:
+    """A packet using up to budget packets, returning its bits and packets used"""
+    if budget <= 1 or depth >= MAX_DEPTH:
+        return _literal(rng), 1
+
+    type_id = rng.choice((0, 1, 2, 3, 5, 6, 7))
+    if type_id >= 5:
+        # Comparisons always have two subpackets
+        children = 2
+    else:
+        children = rng.randint(1, min(budget - 1, 8))
+
+    subpackets = []
+    used = 1
+    for i in range(children):
+        remaining = children - i - 1
+        # Leave at least one packet for each of the remaining children
+        share = max(1, (budget - used - remaining) // (remaining + 1))
+        if i == 0 and rng.random() < 0.5:
+            # Put most of the budget into one child, so packets nest deeply
+            share = budget - used - remaining
+        bits, count = _packet(rng, max(share, 1), depth + 1)
+        subpackets.append(bits)
+        used += count
+
+    sub_bits = "".join(subpackets)
+    if len(sub_bits) < 2**15 and rng.random() < 0.5:
+        header = f"0{len(sub_bits):015b}"
+    else:
+        header = f"1{len(subpackets):011b}"
+    return f"{rng.randrange(8):03b}{type_id:03b}{header}{sub_bits}", used
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """A transmission of about size packets, nested up to 200 deep"""
+    bits, _ = _packet(rng, max(size, 1), 0)
+    bits += "0" * (-len(bits) % 4)
+    f.write(f"{int(bits, 2):0{len(bits) // 4}X}\n")
@@ -0,0 +1,11 @@
+import random
+from typing import TextIO
+
+
+def generate(f: TextIO, size: int, rng: random.Random):
+    """A target area about size units away, below the launcher"""
+    x_start = rng.randint(max(size // 2, 10), max(size, 20))
+    y_start = -rng.randint(20, 99)
+    x_end = x_start + rng.randint(5, 30)
+    y_end = min(y_start + rng.randint(5, 20), -1)
+    f.write(f"target area: x={x_start}..{x_end}, y={y_start}..{y_end}\n")
@@ -3,7 +3,7 @@ from itertools import count
 from time import sleep
 from typing import TextIO
 
-from solutions.common import Point
+from solutions.common import Point, load_input
 
 FILE = "solutions/day_17/input.txt"
 TEST_FILE = "solutions/day_17/test_input.txt"
@@ -73,8 +73,7 @@ def launch_probe(
 
 
 def solve_part_a() -> int:
-    with open(FILE) as f:
-        x_range, y_range = get_target_ranges(f)
+    x_range, y_range = load_input(FILE, get_target_ranges)
 
     highest_y = 0
     # Chosen somewhat arbitrarily rather than find a nice way to terminate
@@ -88,8 +87,7 @@ def solve_part_a() -> int:
 
 
 def solve_part_b() -> int:
-    with open(FILE) as f:
-        x_range, y_range = get_target_ranges(f)
+    x_range, y_range = load_input(FILE, get_target_ranges)
 
     hit_velocities = []
     # Chosen somewhat arbitrarily rather than find a nice way to terminate
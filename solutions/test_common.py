@@ -0,0 +1,294 @@
+import io
+import os
+import random
+
+import pytest
+
+from solutions import common
+from solutions.common import (
+    DIAGONALS,
+    ULDR,
+    Adjacency,
+    DenseIntGrid,
+    IntGrid,
+    Point,
+    adjacent_points_and_values,
+    bypass_input_cache,
+    clear_input_cache,
+    load_input,
+    pack_point,
+    read_ints,
+    unpack_point,
+)
+
+GRID = "123\n456\n"
+
+
+@pytest.mark.parametrize("sparse", [True, False])
+def test_from_file(sparse: bool):
+    grid = IntGrid.from_file(io.StringIO(GRID), sparse=sparse)
+    assert isinstance(grid, DenseIntGrid) is not sparse
+    assert list(grid) == [
+        (Point(0, 0), 1),
+        (Point(1, 0), 2),
+        (Point(2, 0), 3),
+        (Point(0, 1), 4),
+        (Point(1, 1), 5),
+        (Point(2, 1), 6),
+    ]
+    assert grid.bounds == (Point(0, 0), Point(2, 1))
+    assert grid[Point(1, 1)] == 5
+    assert grid.get(Point(3, 0)) is None
+    assert Point(0, 2) not in grid
+
+
+def test_from_dict_stays_sparse():
+    grid = IntGrid.from_dict({Point(0, 0): 1, Point(10, 10): 2})
+    assert not isinstance(grid, DenseIntGrid)
+
+
+def test_add_with_gap():
+    grid = IntGrid.from_file(io.StringIO(GRID))
+    grid += IntGrid.from_dict({Point(0, 2): 7})
+    assert isinstance(grid, DenseIntGrid)
+    assert len(grid) == 7
+    assert Point(1, 2) not in grid
+    assert grid.grid == {
+        **IntGrid.from_file(io.StringIO(GRID), sparse=True).grid,
+        Point(0, 2): 7,
+    }
+
+    grid[Point(1, 2)] = 8
+    grid[Point(2, 2)] = 1000
+    assert len(grid) == 9
+    assert grid.present is None
+    assert grid[Point(2, 2)] == 1000
+
+
+def test_set_outside_bounds():
+    grid = IntGrid.from_file(io.StringIO(GRID))
+    grid[Point(-1, 2)] = 7
+    assert isinstance(grid, DenseIntGrid)
+    assert grid.bounds == (Point(-1, 0), Point(2, 2))
+    assert len(grid) == 7
+    assert grid[Point(-1, 2)] == 7
+    assert grid[Point(2, 1)] == 6
+
+    # Far enough away that the box would be mostly gaps
+    with pytest.raises(ValueError):
+        grid[Point(100, 100)] = 9
+    assert len(grid) == 7
+    assert grid[Point(2, 1)] == 6
+
+
+def test_from_grid():
+    sparse = IntGrid.from_dict({Point(1, 1): 3, Point(3, 2): 4}, sparse=True)
+    dense = DenseIntGrid.from_grid(sparse)
+    assert dense.bounds == sparse.bounds
+    assert dict(dense) == sparse.grid
+    assert DenseIntGrid.from_grid(dense) is dense
+
+
+def test_dense_grid_is_read_only():
+    grid = IntGrid.from_file(io.StringIO(GRID))
+    with pytest.raises(TypeError):
+        grid.grid[Point(0, 0)] = 5
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_from_file_rejects_non_digits(sparse):
+    with pytest.raises(ValueError):
+        IntGrid.from_file(io.StringIO("12#\n456\n"), sparse=sparse)
+
+
+@pytest.mark.parametrize("text", ["12\n34\n\n", "\n12\n\n34\n"])
+def test_from_file_blank_lines(text):
+    dense = IntGrid.from_file(io.StringIO(text))
+    sparse = IntGrid.from_file(io.StringIO(text), sparse=True)
+    assert isinstance(dense, DenseIntGrid)
+    assert dense.grid == sparse.grid
+    assert dense.bounds == sparse.bounds
+
+
+def test_pack_point():
+    assert pack_point(Point(2, 3), 5) == 17
+    assert unpack_point(17, 5) == Point(2, 3)
+
+
+@pytest.mark.parametrize("sparse", [True, False])
+def test_tuple_lookups(sparse: bool):
+    grid = IntGrid.from_file(io.StringIO(GRID), sparse=sparse)
+    assert grid[(2, 1)] == 6
+    assert adjacent_points_and_values(grid, (1, 0)) == [
+        (Point(1, 1), 5),
+        (Point(0, 0), 1),
+        (Point(2, 0), 3),
+    ]
+
+
+def test_dense_pack():
+    grid = IntGrid.from_dict({Point(5, 5): 1, Point(6, 5): 2, Point(5, 6): 3})
+    assert grid.pack(Point(5, 6)) == 2
+    assert grid.unpack(2) == Point(5, 6)
+    assert grid.values[grid.pack(Point(6, 5))] == 2
+
+
+@pytest.mark.parametrize(
+    "diagonal,adjacent",
+    [
+        (False, [[3, 1], [4, 0, 2], [5, 1], [0, 4], [1, 3, 5], [2, 4]]),
+        (
+            True,
+            [
+                [3, 1, 4],
+                [4, 0, 2, 3, 5],
+                [5, 1, 4],
+                [0, 4, 1],
+                [1, 3, 5, 0, 2],
+                [2, 4, 1],
+            ],
+        ),
+    ],
+)
+def test_adjacency(diagonal: bool, adjacent: list[list[int]]):
+    grid = IntGrid.from_file(io.StringIO(GRID))
+    adjacency = grid.adjacency(diagonal=diagonal)
+    assert len(adjacency) == 6
+    assert [list(adjacency[i]) for i in range(6)] == adjacent
+
+
+def test_adjacency_with_gap():
+    grid = IntGrid.from_dict({Point(0, 0): 1, Point(1, 0): 2, Point(1, 1): 3})
+    adjacency = grid.adjacency()
+    assert [list(adjacency[i]) for i in range(4)] == [[1], [3, 0], [], [1]]
+
+
+@pytest.mark.parametrize("diagonal", [False, True])
+@pytest.mark.parametrize("gaps", [False, True])
+def test_adjacency_matches_neighbours(diagonal: bool, gaps: bool):
+    rng = random.Random(4)
+    directions = ULDR + DIAGONALS if diagonal else ULDR
+    for width, height in [(1, 1), (1, 5), (5, 1), (2, 2), (7, 4)]:
+        present = None
+        if gaps:
+            present = bytearray(rng.random() < 0.7 for _ in range(width * height))
+        adjacency = Adjacency.build(width, height, diagonal, present)
+        assert adjacency.targets.typecode == "h"
+        for i in range(width * height):
+            z, x = divmod(i, width)
+            expected = [
+                (z + dz) * width + x + dx
+                for dx, dz in directions
+                if 0 <= x + dx < width
+                and 0 <= z + dz < height
+                and (
+                    present is None or present[i] and present[(z + dz) * width + x + dx]
+                )
+            ]
+            assert list(adjacency[i]) == expected
+
+
+def test_load_input(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, "INPUT_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "input.txt"
+    path.write_text(GRID)
+    parsed = []
+
+    def parse(f) -> list[str]:
+        parsed.append(f.name)
+        return f.read().split()
+
+    first = load_input(str(path), parse)
+    first.append("modified")
+    assert load_input(str(path), parse) == ["123", "456"]
+    assert len(parsed) == 1
+
+    clear_input_cache()
+    assert load_input(str(path), parse) == ["123", "456"]
+    assert len(parsed) == 1
+
+
+def _split_file(f) -> list[str]:
+    return f.read().split()
+
+
+def test_load_input_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, "INPUT_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "input.txt"
+    path.write_text(GRID)
+    stat = path.stat()
+    assert load_input(str(path), _split_file) == ["123", "456"]
+
+    # Same size and modification time, but different contents
+    path.write_text(GRID[::-1])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    clear_input_cache()
+    assert load_input(str(path), _split_file) == ["654", "321"]
+
+    # Any change to the solutions modules, not only the parser's own
+    sidecars = set(os.listdir(tmp_path / "cache"))
+    monkeypatch.setattr(common, "_sources_digest", lambda: "changed")
+    clear_input_cache()
+    load_input(str(path), _split_file)
+    assert len(set(os.listdir(tmp_path / "cache")) - sidecars) == 1
+
+
+def test_bypass_input_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, "INPUT_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "input.txt"
+    path.write_text(GRID)
+    parsed = []
+
+    def parse(f) -> list[str]:
+        parsed.append(f.name)
+        return f.read().split()
+
+    with bypass_input_cache():
+        assert load_input(str(path), parse) == ["123", "456"]
+        assert load_input(str(path), parse) == ["123", "456"]
+    assert len(parsed) == 2
+    assert not (tmp_path / "cache").exists()
+
+    load_input(str(path), parse)
+    load_input(str(path), parse)
+    assert len(parsed) == 3
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+@pytest.mark.parametrize("contents", ["3,-4,5\n", "3\n-4\n5\n"])
+def test_read_ints(tmp_path, contents: str, use_mmap: bool):
+    path = tmp_path / "input.txt"
+    path.write_text(contents)
+    with open(path) as f:
+        assert list(read_ints(f, use_mmap=use_mmap)) == [3, -4, 5]
+    assert list(read_ints(io.StringIO(contents))) == [3, -4, 5]
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 1 << 22])
+def test_read_ints_mmap_chunks(tmp_path, monkeypatch, chunk):
+    monkeypatch.setattr(common, "_MMAP_CHUNK", chunk)
+    path = tmp_path / "input.txt"
+    path.write_text("12,-345\n6789\n0,\n77")
+    with open(path) as f:
+        assert list(read_ints(f, use_mmap=True)) == [12, -345, 6789, 0, 77]
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+@pytest.mark.parametrize("contents", ["1.5\n", "1a2\n"])
+def test_read_ints_rejects_malformed(tmp_path, contents: str, use_mmap: bool):
+    path = tmp_path / "input.txt"
+    path.write_text(contents)
+    with open(path) as f, pytest.raises(ValueError):
+        read_ints(f, use_mmap=use_mmap)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_read_ints_after_readline(tmp_path, use_mmap: bool):
+    path = tmp_path / "input.txt"
+    path.write_text("header line\n1,2\n3\n")
+    with open(path) as f:
+        f.readline()
+        assert list(read_ints(f, use_mmap=use_mmap)) == [1, 2, 3]
+    with open(path, "rb") as f:
+        f.readline()
+        assert list(read_ints(f, use_mmap=use_mmap)) == [1, 2, 3]
@@ -0,0 +1,41 @@
+import contextlib
+import io
+import random
+
+import pytest
+
+from solutions import PARTS, available_days, common, load_day, load_generator, load_part
+from solutions.day_13 import generate as day_13_generate
+
+# Random grids of octopuses often never all flash at once, so day 11 part b
+# finds no answer for them
+SKIP = {("11", "b")}
+
+
+@pytest.mark.parametrize("day", available_days())
+def test_generated_input_is_solvable(day, tmp_path, monkeypatch):
+    path = tmp_path / "input.txt"
+    with open(path, "w") as f:
+        load_generator(day)(f, 10, random.Random(1))
+
+    monkeypatch.setattr(common, "INPUT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(load_day(day), "FILE", str(path))
+    for part in PARTS:
+        if (day, part) in SKIP:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_part(day, part)()
+
+
+def test_generators_grow_past_their_defaults(monkeypatch):
+    f = io.StringIO()
+    load_generator("03")(f, 5000, random.Random(1))
+    assert len(set(f.getvalue().split())) == 5000
+
+    # One fold a side leaves 960 places for dots, too few for 1000 without more
+    monkeypatch.setattr(day_13_generate, "FOLDS_PER_AXIS", 1)
+    f = io.StringIO()
+    day_13_generate.generate(f, 1000, random.Random(1))
+    dots, _, folds = f.getvalue().partition("\n\n")
+    assert len(dots.split()) == 1000
+    assert len(folds.split("\n")) > 3